@@ -12,6 +12,7 @@ Creates all tables:
 - chain_sync_state
 """
 
+import os
 from collections.abc import Sequence
 
 import sqlalchemy as sa
@@ -225,27 +226,71 @@ def upgrade() -> None:
         ),
     )
 
-    # Create indexes
-    op.create_index("idx_agreements_status", "agreements", ["status"])
-    op.create_index(
-        "idx_agreements_payer_status", "agreements", ["payer_id", "status"]
-    )
-    op.create_index(
-        "idx_agreements_payee_status", "agreements", ["payee_id", "status"]
-    )
-    op.create_index(
-        "idx_onchain_events_chain_block_log",
-        "onchain_events",
-        ["chain_id", "block_number", "log_index"],
-    )
+    # Restore pipelines set TRUSTFLOW_SKIP_INDEXES to load data into bare
+    # tables first; 011_post_load_indexes builds what is still needed after.
+    if os.environ.get("TRUSTFLOW_SKIP_INDEXES"):
+        return
+
+    # Create indexes outside the schema transaction so the builds take
+    # SHARE UPDATE EXCLUSIVE locks instead of blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_agreements_status",
+            "agreements",
+            ["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_agreements_payer_status",
+            "agreements",
+            ["payer_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_agreements_payee_status",
+            "agreements",
+            ["payee_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_onchain_events_chain_block_log",
+            "onchain_events",
+            ["chain_id", "block_number", "log_index"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
     # Drop indexes
-    op.drop_index("idx_onchain_events_chain_block_log", table_name="onchain_events")
-    op.drop_index("idx_agreements_payee_status", table_name="agreements")
-    op.drop_index("idx_agreements_payer_status", table_name="agreements")
-    op.drop_index("idx_agreements_status", table_name="agreements")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_onchain_events_chain_block_log",
+            table_name="onchain_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_agreements_payee_status",
+            table_name="agreements",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_agreements_payer_status",
+            table_name="agreements",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_agreements_status",
+            table_name="agreements",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
 
     # Drop tables
     op.drop_table("chain_sync_state")
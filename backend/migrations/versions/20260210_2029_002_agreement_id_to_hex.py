@@ -11,6 +11,7 @@ with the blockchain ecosystem.
 
 from collections.abc import Sequence
 
+import sqlalchemy as sa
 from alembic import op
 
 revision: str = "002_agreement_id_hex"
@@ -18,6 +19,14 @@ down_revision: str | None = "001_initial_schema"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+VARCHAR_66 = sa.String(66)
+NUMERIC_78_0 = sa.Numeric(78, 0)
+
+_AGREEMENT_FOREIGN_KEYS = (
+    ("disputes", "fk_disputes_agreement_id"),
+    ("onchain_events", "onchain_events_agreement_id_fkey"),
+)
+
 
 def upgrade() -> None:
     # Drop FK constraints referencing agreements.agreement_id
@@ -32,41 +41,31 @@ def upgrade() -> None:
         type_="foreignkey",
     )
 
-    # Alter column types from NUMERIC(78,0) to VARCHAR(66)
+    # Alter column types from NUMERIC(78,0) to VARCHAR(66).
+    # No trigger suspension is needed: a type-change rewrite does not fire
+    # row triggers, and the FK triggers are already gone with the dropped
+    # constraints.
     op.alter_column(
         "agreements",
         "agreement_id",
-        type_=type_from_string("VARCHAR(66)"),
+        type_=VARCHAR_66,
         postgresql_using="'0x' || lpad(to_hex(agreement_id::bigint), 64, '0')",
     )
     op.alter_column(
         "disputes",
         "agreement_id",
-        type_=type_from_string("VARCHAR(66)"),
+        type_=VARCHAR_66,
         postgresql_using="'0x' || lpad(to_hex(agreement_id::bigint), 64, '0')",
     )
     op.alter_column(
         "onchain_events",
         "agreement_id",
-        type_=type_from_string("VARCHAR(66)"),
+        type_=VARCHAR_66,
         postgresql_using="'0x' || lpad(to_hex(agreement_id::bigint), 64, '0')",
     )
 
     # Re-create FK constraints
-    op.create_foreign_key(
-        "fk_disputes_agreement_id",
-        "disputes",
-        "agreements",
-        ["agreement_id"],
-        ["agreement_id"],
-    )
-    op.create_foreign_key(
-        "onchain_events_agreement_id_fkey",
-        "onchain_events",
-        "agreements",
-        ["agreement_id"],
-        ["agreement_id"],
-    )
+    _recreate_agreement_foreign_keys()
 
 
 def downgrade() -> None:
@@ -88,47 +87,41 @@ def downgrade() -> None:
     op.alter_column(
         "agreements",
         "agreement_id",
-        type_=type_from_string("NUMERIC(78,0)"),
+        type_=NUMERIC_78_0,
         postgresql_using=conversion,
     )
     op.alter_column(
         "disputes",
         "agreement_id",
-        type_=type_from_string("NUMERIC(78,0)"),
+        type_=NUMERIC_78_0,
         postgresql_using=conversion,
     )
     op.alter_column(
         "onchain_events",
         "agreement_id",
-        type_=type_from_string("NUMERIC(78,0)"),
+        type_=NUMERIC_78_0,
         postgresql_using=conversion,
     )
 
     # Re-create FK constraints
-    op.create_foreign_key(
-        "fk_disputes_agreement_id",
-        "disputes",
-        "agreements",
-        ["agreement_id"],
-        ["agreement_id"],
-    )
-    op.create_foreign_key(
-        "onchain_events_agreement_id_fkey",
-        "onchain_events",
-        "agreements",
-        ["agreement_id"],
-        ["agreement_id"],
-    )
+    _recreate_agreement_foreign_keys()
+
+
+def _recreate_agreement_foreign_keys() -> None:
+    """Re-create the agreement FKs as NOT VALID and validate them afterwards.
 
+    Adding the constraints NOT VALID only needs a brief lock; the validation
+    scan runs after the rewrite transaction commits, under SHARE UPDATE
+    EXCLUSIVE, so reads and writes keep flowing while it checks the rows.
+    """
+    for table, constraint in _AGREEMENT_FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+            "FOREIGN KEY (agreement_id) REFERENCES agreements(agreement_id) "
+            "NOT VALID"
+        )
 
-def type_from_string(type_str: str):
-    """Helper to create SA type from string for alter_column."""
-    import sqlalchemy as sa
+    with op.get_context().autocommit_block():
+        for table, constraint in _AGREEMENT_FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
 
-    if type_str.startswith("VARCHAR"):
-        length = int(type_str.split("(")[1].rstrip(")"))
-        return sa.String(length)
-    elif type_str.startswith("NUMERIC"):
-        parts = type_str.split("(")[1].rstrip(")").split(",")
-        return sa.Numeric(int(parts[0]), int(parts[1]))
-    raise ValueError(f"Unsupported type: {type_str}")
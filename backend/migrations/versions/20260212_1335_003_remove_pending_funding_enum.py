@@ -38,11 +38,15 @@ def upgrade() -> None:
         )
     """)
 
+    # Single rewrite: remap leftover PENDING_FUNDING rows while converting
     op.execute(f"""
         ALTER TABLE agreements
         ALTER COLUMN status
         TYPE {TMP_TYPE}
-        USING status::text::{TMP_TYPE}
+        USING (
+            CASE WHEN status::text = 'PENDING_FUNDING' THEN 'CREATED'
+            ELSE status::text END
+        )::{TMP_TYPE}
     """)
 
     op.execute(f"DROP TYPE {OLD_TYPE}")
@@ -29,8 +29,12 @@ def upgrade() -> None:
     op.create_unique_constraint("uq_users_oauth_id", "users", ["oauth_id"])
     
     # Drop unused indexes as requested
-    op.drop_index("idx_agreements_payer_status", table_name="agreements")
-    op.drop_index("idx_agreements_payee_status", table_name="agreements")
+    op.drop_index(
+        "idx_agreements_payer_status", table_name="agreements", if_exists=True
+    )
+    op.drop_index(
+        "idx_agreements_payee_status", table_name="agreements", if_exists=True
+    )
 
     # Create sessions table
     op.create_table(
@@ -51,14 +55,25 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("refresh_token_hash", name="uq_sessions_refresh_token_hash"),
     )
-    op.create_index(
-        "idx_sessions_user_id", "sessions", ["user_id"], unique=False
-    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_sessions_user_id",
+            "sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
     # Drop sessions table
-    op.drop_index("idx_sessions_user_id", table_name="sessions")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_sessions_user_id",
+            table_name="sessions",
+            postgresql_concurrently=True,
+        )
     op.drop_table("sessions")
 
     # Re-create indexes
@@ -0,0 +1,54 @@
+"""Replace agreements status index with a partial DISPUTED index
+
+Revision ID: 006_partial_disputed_index
+Revises: 005_relax_disputes_constraints
+Create Date: 2026-10-15
+
+idx_agreements_status indexes a six-value column and is rarely chosen by
+the planner, while still being written on every status transition. It is
+replaced by a partial index covering only disputed agreements.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "006_partial_disputed_index"
+down_revision: str | None = "005_relax_disputes_constraints"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_agreements_disputed",
+            "agreements",
+            ["updated_at"],
+            postgresql_where=sa.text("status = 'DISPUTED'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_agreements_status",
+            table_name="agreements",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_agreements_status",
+            "agreements",
+            ["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_agreements_disputed",
+            table_name="agreements",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,67 @@
+"""Split disputes status consistency check
+
+Revision ID: 007_split_disputes_status_check
+Revises: 006_partial_disputed_index
+Create Date: 2026-10-15
+
+Replaces the disjunctive ck_disputes_status_consistency with one check per
+status, so violations name the exact rule that failed. Both constraints
+are added NOT VALID and validated after the swap commits, which keeps the
+exclusive lock on disputes short.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "007_split_disputes_status_check"
+down_revision: str | None = "006_partial_disputed_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COMBINED_CONSTRAINT = (
+    "(status = 'OPEN' AND resolved_at IS NULL AND resolution IS NULL "
+    "AND resolution_tx_hash IS NULL AND justification IS NULL) OR "
+    "(status = 'RESOLVED' AND resolved_at IS NOT NULL AND resolution IS NOT NULL "
+    "AND resolution_tx_hash IS NOT NULL)"
+)
+
+_SPLIT_CONSTRAINTS = (
+    (
+        "ck_disputes_open_nulls",
+        "status <> 'OPEN' OR (resolved_at IS NULL AND resolution IS NULL "
+        "AND resolution_tx_hash IS NULL AND justification IS NULL)",
+    ),
+    (
+        "ck_disputes_resolved_notnulls",
+        "status <> 'RESOLVED' OR (resolved_at IS NOT NULL "
+        "AND resolution IS NOT NULL AND resolution_tx_hash IS NOT NULL)",
+    ),
+)
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        "ck_disputes_status_consistency",
+        "disputes",
+        type_="check",
+    )
+    for name, condition in _SPLIT_CONSTRAINTS:
+        op.execute(
+            f"ALTER TABLE disputes ADD CONSTRAINT {name} CHECK ({condition}) "
+            "NOT VALID"
+        )
+
+    with op.get_context().autocommit_block():
+        for name, _ in _SPLIT_CONSTRAINTS:
+            op.execute(f"ALTER TABLE disputes VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name, _ in _SPLIT_CONSTRAINTS:
+        op.drop_constraint(name, "disputes", type_="check")
+    op.create_check_constraint(
+        "ck_disputes_status_consistency",
+        "disputes",
+        _COMBINED_CONSTRAINT,
+    )
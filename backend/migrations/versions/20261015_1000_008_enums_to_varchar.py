@@ -0,0 +1,167 @@
+"""Replace native PostgreSQL enums with VARCHAR and CHECK constraints
+
+Revision ID: 008_enums_to_varchar
+Revises: 007_split_disputes_status_check
+Create Date: 2026-10-15
+
+Native enums make every value change a type swap plus a full rewrite of the
+owning table (see 003). Storing the values as VARCHAR guarded by a CHECK
+constraint turns future additions into a NOT VALID constraint swap.
+
+Constraints and the partial index whose expressions compare against enum
+literals are dropped before the conversion and re-created afterwards, since
+PostgreSQL would otherwise re-parse them with the old enum casts.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008_enums_to_varchar"
+down_revision: str | None = "007_split_disputes_status_check"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, enum type, values, server default)
+_ENUM_COLUMNS = (
+    (
+        "agreements",
+        "arbitration_policy",
+        "arbitration_policy_enum",
+        ("NONE", "WITH_ARBITRATOR"),
+        None,
+    ),
+    (
+        "agreements",
+        "status",
+        "agreement_status_enum",
+        ("DRAFT", "CREATED", "FUNDED", "DISPUTED", "RELEASED", "REFUNDED"),
+        "DRAFT",
+    ),
+    (
+        "disputes",
+        "status",
+        "dispute_status_enum",
+        ("OPEN", "RESOLVED"),
+        "OPEN",
+    ),
+    (
+        "disputes",
+        "resolution",
+        "dispute_resolution_enum",
+        ("RELEASE", "REFUND"),
+        None,
+    ),
+    (
+        "onchain_events",
+        "event_name",
+        "onchain_event_name_enum",
+        (
+            "AGREEMENT_CREATED",
+            "PAYMENT_FUNDED",
+            "DISPUTE_OPENED",
+            "PAYMENT_RELEASED",
+            "PAYMENT_REFUNDED",
+        ),
+        None,
+    ),
+    (
+        "users",
+        "oauth_provider",
+        "oauth_provider_enum",
+        ("GOOGLE",),
+        None,
+    ),
+)
+
+# Check constraints comparing enum columns against literals
+_DEPENDENT_CHECKS = (
+    (
+        "agreements",
+        "ck_agreements_policy_arbitrator",
+        "(arbitration_policy = 'NONE' AND arbitrator_id IS NULL) OR "
+        "(arbitration_policy = 'WITH_ARBITRATOR' AND arbitrator_id IS NOT NULL)",
+    ),
+    (
+        "disputes",
+        "ck_disputes_open_nulls",
+        "status <> 'OPEN' OR (resolved_at IS NULL AND resolution IS NULL "
+        "AND resolution_tx_hash IS NULL AND justification IS NULL)",
+    ),
+    (
+        "disputes",
+        "ck_disputes_resolved_notnulls",
+        "status <> 'RESOLVED' OR (resolved_at IS NOT NULL "
+        "AND resolution IS NOT NULL AND resolution_tx_hash IS NOT NULL)",
+    ),
+)
+
+
+def _drop_dependents() -> None:
+    op.drop_index("idx_agreements_disputed", table_name="agreements")
+    for table, name, _ in _DEPENDENT_CHECKS:
+        op.drop_constraint(name, table, type_="check")
+
+
+def _create_dependents() -> None:
+    for table, name, condition in _DEPENDENT_CHECKS:
+        op.create_check_constraint(name, table, condition)
+    op.create_index(
+        "idx_agreements_disputed",
+        "agreements",
+        ["updated_at"],
+        postgresql_where=sa.text("status = 'DISPUTED'"),
+    )
+
+
+def upgrade() -> None:
+    _drop_dependents()
+
+    for table, column, type_name, _, default in _ENUM_COLUMNS:
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR(32) USING {column}::text"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
+        op.execute(f"DROP TYPE {type_name}")
+
+    for table, column, _, values, _ in _ENUM_COLUMNS:
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_{column} "
+            f"CHECK ({column} IN ({allowed})) NOT VALID"
+        )
+
+    _create_dependents()
+
+    with op.get_context().autocommit_block():
+        for table, column, *_ in _ENUM_COLUMNS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT ck_{table}_{column}")
+
+
+def downgrade() -> None:
+    _drop_dependents()
+
+    for table, column, type_name, values, default in _ENUM_COLUMNS:
+        op.drop_constraint(f"ck_{table}_{column}", table, type_="check")
+
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({allowed})")
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
+
+    _create_dependents()
@@ -0,0 +1,48 @@
+"""Cover dispute lookups by agreement with an INCLUDE index
+
+Revision ID: 009_disputes_agreement_covering
+Revises: 008_enums_to_varchar
+Create Date: 2026-10-15
+
+Replaces the plain UNIQUE constraint on disputes.agreement_id with a unique
+index that also carries status and resolved_at, so dispute-state-by-agreement
+lookups can be answered by an index-only scan while still enforcing one
+dispute per agreement.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "009_disputes_agreement_covering"
+down_revision: str | None = "008_enums_to_varchar"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_disputes_agreement_covering",
+            "disputes",
+            ["agreement_id"],
+            unique=True,
+            postgresql_include=["status", "resolved_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    op.drop_constraint("disputes_agreement_id_key", "disputes", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        "disputes_agreement_id_key", "disputes", ["agreement_id"]
+    )
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_disputes_agreement_covering",
+            table_name="disputes",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,43 @@
+"""Store onchain_events payload as JSONB
+
+Revision ID: 010_onchain_payload_jsonb
+Revises: 009_disputes_agreement_covering
+Create Date: 2026-10-15
+
+JSON keeps the raw text and re-parses it on every read; JSONB stores the
+decoded form once at insert time, which suits this write-once, read-many
+ledger.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "010_onchain_payload_jsonb"
+down_revision: str | None = "009_disputes_agreement_covering"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "onchain_events",
+        "payload",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="payload::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "onchain_events",
+        "payload",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="payload::json",
+    )
@@ -0,0 +1,37 @@
+"""Build initial-schema indexes skipped during a restore
+
+Revision ID: 011_post_load_indexes
+Revises: 010_onchain_payload_jsonb
+Create Date: 2026-10-15
+
+When 001 runs with TRUSTFLOW_SKIP_INDEXES set, tables are created without
+their secondary indexes so a restore can COPY into bare tables. Upgrading
+to 010_onchain_payload_jsonb, loading the data, then upgrading to head builds
+the surviving index once over the loaded rows. On a regular deployment the
+index already exists and this revision is a no-op.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "011_post_load_indexes"
+down_revision: str | None = "010_onchain_payload_jsonb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_onchain_events_chain_block_log",
+            "onchain_events",
+            ["chain_id", "block_number", "log_index"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # The index belongs to 001; it is only dropped when that revision is.
+    pass
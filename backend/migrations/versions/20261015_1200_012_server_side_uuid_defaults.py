@@ -0,0 +1,29 @@
+"""Generate UUID primary keys in the database
+
+Revision ID: 012_server_side_uuid_defaults
+Revises: 011_post_load_indexes
+Create Date: 2026-10-15
+
+gen_random_uuid() is built into PostgreSQL 13+, so no extension is needed.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "012_server_side_uuid_defaults"
+down_revision: str | None = "011_post_load_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLES = ("users", "sessions", "disputes")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,50 @@
+"""Store wallet addresses as BYTEA
+
+Revision ID: 013_wallet_address_bytea
+Revises: 012_server_side_uuid_defaults
+Create Date: 2026-10-15
+
+A 20-byte address takes 42 characters as text. Storing the raw bytes
+halves the column and its unique index, and replaces the per-write regex
+check with a length check. The application keeps using the 0x-prefixed
+hex form through the HexBinary column type.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "013_wallet_address_bytea"
+down_revision: str | None = "012_server_side_uuid_defaults"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("ck_users_wallet_address_format", "users", type_="check")
+    op.execute(
+        "ALTER TABLE users ALTER COLUMN wallet_address TYPE bytea "
+        "USING decode(substring(wallet_address FROM 3), 'hex')"
+    )
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT ck_users_wallet_address_length "
+        "CHECK (octet_length(wallet_address) = 20) NOT VALID"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE users VALIDATE CONSTRAINT ck_users_wallet_address_length"
+        )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_users_wallet_address_length", "users", type_="check")
+    op.execute(
+        "ALTER TABLE users ALTER COLUMN wallet_address TYPE text "
+        "USING '0x' || encode(wallet_address, 'hex')"
+    )
+    op.create_check_constraint(
+        "ck_users_wallet_address_format",
+        "users",
+        "wallet_address ~ '^0x[0-9a-f]{40}$'",
+    )
@@ -0,0 +1,45 @@
+"""Index agreement participants together with status
+
+Revision ID: 014_participant_status_indexes
+Revises: 013_wallet_address_bytea
+Create Date: 2026-10-15
+
+Agreement lists and lookups filter on payer_id, payee_id or arbitrator_id
+(optionally with status), and none of those columns is indexed. One
+(participant, status) index per role lets Postgres answer the OR of the
+three predicates with a bitmap OR of index scans.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "014_participant_status_indexes"
+down_revision: str | None = "013_wallet_address_bytea"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_PARTICIPANT_COLUMNS = ("payer_id", "payee_id", "arbitrator_id")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in _PARTICIPANT_COLUMNS:
+            op.create_index(
+                f"idx_agreements_{column.removesuffix('_id')}_status",
+                "agreements",
+                [column, "status"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in _PARTICIPANT_COLUMNS:
+            op.drop_index(
+                f"idx_agreements_{column.removesuffix('_id')}_status",
+                table_name="agreements",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
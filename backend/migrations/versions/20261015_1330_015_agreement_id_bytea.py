@@ -0,0 +1,79 @@
+"""Store agreement_id as BYTEA
+
+Revision ID: 015_agreement_id_bytea
+Revises: 014_participant_status_indexes
+Create Date: 2026-10-15
+
+agreement_id is a bytes32 value kept as a 66-character hex string. It is
+the agreements primary key and is repeated in disputes and onchain_events,
+so storing the 32 raw bytes halves every index it appears in and compares
+bytewise instead of through the collation. The application keeps using the
+0x-prefixed hex form through the HexBinary column type.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "015_agreement_id_bytea"
+down_revision: str | None = "014_participant_status_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_AGREEMENT_ID_TABLES = ("agreements", "disputes", "onchain_events")
+
+_AGREEMENT_FOREIGN_KEYS = (
+    ("disputes", "fk_disputes_agreement_id"),
+    ("onchain_events", "onchain_events_agreement_id_fkey"),
+)
+
+
+def upgrade() -> None:
+    for table, constraint in _AGREEMENT_FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_="foreignkey")
+
+    for table in _AGREEMENT_ID_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN agreement_id TYPE bytea "
+            "USING decode(substring(agreement_id FROM 3), 'hex')"
+        )
+
+    op.execute(
+        "ALTER TABLE agreements ADD CONSTRAINT ck_agreements_agreement_id_length "
+        "CHECK (octet_length(agreement_id) = 32) NOT VALID"
+    )
+    _recreate_agreement_foreign_keys()
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE agreements "
+            "VALIDATE CONSTRAINT ck_agreements_agreement_id_length"
+        )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_agreements_agreement_id_length", "agreements", type_="check")
+    for table, constraint in _AGREEMENT_FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_="foreignkey")
+
+    for table in _AGREEMENT_ID_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN agreement_id TYPE varchar(66) "
+            "USING '0x' || encode(agreement_id, 'hex')"
+        )
+
+    _recreate_agreement_foreign_keys()
+
+
+def _recreate_agreement_foreign_keys() -> None:
+    """Re-create the agreement FKs as NOT VALID and validate them afterwards."""
+    for table, constraint in _AGREEMENT_FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+            "FOREIGN KEY (agreement_id) REFERENCES agreements(agreement_id) "
+            "NOT VALID"
+        )
+
+    with op.get_context().autocommit_block():
+        for table, constraint in _AGREEMENT_FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
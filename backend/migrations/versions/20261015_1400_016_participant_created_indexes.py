@@ -0,0 +1,71 @@
+"""Extend participant indexes with created_at for ordered agreement lists
+
+Revision ID: 016_participant_created_indexes
+Revises: 015_agreement_id_bytea
+Create Date: 2026-10-15
+
+Agreement lists filter on a participant column and status and then order by
+created_at DESC. Appending created_at DESC to the (participant, status)
+indexes lets each arm of the participant OR return rows already in list
+order. The arbitrator index becomes partial because most agreements have no
+arbitrator. The draft-limit count keeps using the (payer_id, status) prefix.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "016_participant_created_indexes"
+down_revision: str | None = "015_agreement_id_bytea"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_PARTICIPANT_COLUMNS = ("payer_id", "payee_id", "arbitrator_id")
+
+
+def _role(column: str) -> str:
+    return column.removesuffix("_id")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in _PARTICIPANT_COLUMNS:
+            op.create_index(
+                f"idx_agreements_{_role(column)}_status_created",
+                "agreements",
+                [column, "status", sa.text("created_at DESC")],
+                postgresql_where=(
+                    sa.text("arbitrator_id IS NOT NULL")
+                    if column == "arbitrator_id"
+                    else None
+                ),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for column in _PARTICIPANT_COLUMNS:
+            op.drop_index(
+                f"idx_agreements_{_role(column)}_status",
+                table_name="agreements",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in _PARTICIPANT_COLUMNS:
+            op.create_index(
+                f"idx_agreements_{_role(column)}_status",
+                "agreements",
+                [column, "status"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for column in _PARTICIPANT_COLUMNS:
+            op.drop_index(
+                f"idx_agreements_{_role(column)}_status_created",
+                table_name="agreements",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,58 @@
+"""Add a generated participant_ids array with a GIN index to agreements
+
+Revision ID: 017_agreement_participant_ids
+Revises: 016_participant_created_indexes
+Create Date: 2026-10-15
+
+"User participates in the agreement" was an OR over payer_id, payee_id and
+arbitrator_id, which Postgres answers with three index scans combined in a
+bitmap OR. A stored generated array of the three IDs turns it into one
+containment predicate (participant_ids @> ARRAY[:user_id]) served by a
+single GIN index. Adding a stored generated column rewrites the table, so
+run this in a maintenance window on large deployments.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "017_agreement_participant_ids"
+down_revision: str | None = "016_participant_created_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agreements",
+        sa.Column(
+            "participant_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            sa.Computed("ARRAY[payer_id, payee_id, arbitrator_id]", persisted=True),
+            nullable=False,
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_agreements_participant_ids",
+            "agreements",
+            ["participant_ids"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_agreements_participant_ids",
+            table_name="agreements",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column("agreements", "participant_ids")
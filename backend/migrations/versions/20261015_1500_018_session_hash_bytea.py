@@ -0,0 +1,47 @@
+"""Store refresh token hashes as BYTEA
+
+Revision ID: 018_session_hash_bytea
+Revises: 017_agreement_participant_ids
+Create Date: 2026-10-15
+
+The SHA-256 digest of a refresh token takes 64 characters as hex text.
+Storing the raw 32 bytes halves the column and the unique index that every
+refresh, logout and session lookup probes. Existing hex digests convert in
+place, so active sessions stay valid.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "018_session_hash_bytea"
+down_revision: str | None = "017_agreement_participant_ids"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE sessions ALTER COLUMN refresh_token_hash TYPE bytea "
+        "USING decode(refresh_token_hash, 'hex')"
+    )
+    op.execute(
+        "ALTER TABLE sessions ADD CONSTRAINT ck_sessions_refresh_token_hash_length "
+        "CHECK (octet_length(refresh_token_hash) = 32) NOT VALID"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE sessions "
+            "VALIDATE CONSTRAINT ck_sessions_refresh_token_hash_length"
+        )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ck_sessions_refresh_token_hash_length", "sessions", type_="check"
+    )
+    op.execute(
+        "ALTER TABLE sessions ALTER COLUMN refresh_token_hash TYPE varchar "
+        "USING encode(refresh_token_hash, 'hex')"
+    )
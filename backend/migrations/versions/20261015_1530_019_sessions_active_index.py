@@ -0,0 +1,50 @@
+"""Add a partial index over active sessions
+
+Revision ID: 019_sessions_active_index
+Revises: 018_session_hash_bytea
+Create Date: 2026-10-15
+
+enforce_session_limit and revoke_all_for_user only touch a user's sessions
+that are not yet revoked, but idx_sessions_user_id also covers every revoked
+row until cleanup deletes it. A partial index on revoked_at IS NULL holds
+only live sessions, ordered the way the session limit ranks them, so the
+limit check reads at most the handful of rows it keeps. expires_at stays a
+filter on top because now() cannot appear in an index predicate.
+idx_sessions_user_id remains for the users FK cascade.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "019_sessions_active_index"
+down_revision: str | None = "018_session_hash_bytea"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_sessions_active",
+            "sessions",
+            [
+                "user_id",
+                sa.text("last_used_at DESC NULLS LAST"),
+                sa.text("created_at DESC"),
+            ],
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_sessions_active",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
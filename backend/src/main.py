@@ -1,12 +1,14 @@
 """TrustFlow Backend"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.config import settings
+from src.config import get_settings
 from src.modules.agreements.http.exceptions_handler import (
     register_agreements_exception_handlers,
 )
@@ -19,6 +21,7 @@ from src.modules.disputes.http.exceptions_handler import (
 from src.modules.disputes.http.router import router as disputes_router
 from src.modules.users.http.exceptions_handler import register_users_exception_handlers
 from src.modules.users.http.router import router as users_router
+from src.shared.database.session import engine
 from src.modules.auth.http.exceptions_handler import (
     register_auth_exception_handlers
 )
@@ -27,15 +30,32 @@ from src.modules.auth.http.exceptions_handler import (
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan."""
-    # Startup
-    session_cleanup_worker = SessionCleanupWorker()
-    await session_cleanup_worker.start()
-    
-    yield
-    
-    # Shutdown
-    await session_cleanup_worker.stop()
+    # One pooled client for outbound calls (Google OAuth) so connections and
+    # TLS sessions are reused across requests
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=10.0,
+    )
 
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            # Startup
+            session_cleanup_task = task_group.create_task(
+                SessionCleanupWorker().run()
+            )
+
+            yield
+
+            # Shutdown
+            session_cleanup_task.cancel()
+    finally:
+        # Close pooled connections only after the worker's last sweep
+        # committed, and also when the task group exits with an error
+        await engine.dispose()
+        await app.state.http_client.aclose()
+
+
+settings = get_settings()
 
 app = FastAPI(
     title=settings.app_name,
@@ -47,12 +67,16 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins,
+    allow_origins=list(settings.allowed_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Routers and exception handlers are registered at import time on purpose:
+# Starlette snapshots exception handlers when it builds the middleware stack
+# on the first ASGI message, which arrives before lifespan startup runs.
+
 # Register routers
 app.include_router(auth_router, prefix="/api")
 app.include_router(users_router, prefix="/api/v1")
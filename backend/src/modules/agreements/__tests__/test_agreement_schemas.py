@@ -4,13 +4,16 @@ Tests only for custom validation logic.
 """
 
 import uuid
+from datetime import UTC, datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
 
-from src.modules.agreements.core.enums import ArbitrationPolicy
-from src.modules.agreements.schemas import CreateAgreementRequest
+from src.modules.agreements.core.enums import AgreementStatus, ArbitrationPolicy
+from src.modules.agreements.core.models import Agreement
+from src.modules.agreements.schemas import AgreementResponse, CreateAgreementRequest
 
 
 class TestCreateAgreementRequest:
@@ -37,3 +40,69 @@ class TestCreateAgreementRequest:
             )
 
         assert "Amount must be positive" in str(exc_info.value)
+
+    def test_create_request_amount_above_uint256(self) -> None:
+        """Should reject amounts that do not fit in a uint256."""
+        with pytest.raises(ValidationError):
+            CreateAgreementRequest(
+                payee_id=uuid.UUID("00000000-0000-0000-0000-000000000002"),
+                arbitration_policy=ArbitrationPolicy.NONE,
+                amount_wei=2**256,
+            )
+
+    def test_create_request_amount_serializes_as_string(self) -> None:
+        """Should keep wei amounts as decimal strings in JSON."""
+        request = CreateAgreementRequest.model_validate_json(
+            '{"payee_id": "00000000-0000-0000-0000-000000000002", '
+            '"arbitration_policy": "NONE", "amount_wei": "1000000000000000000"}'
+        )
+
+        assert request.amount_wei == 10**18
+        assert '"amount_wei":"1000000000000000000"' in request.model_dump_json()
+
+
+class TestAgreementResponse:
+    """Tests for AgreementResponse construction from ORM rows."""
+
+    @staticmethod
+    def _agreement() -> Agreement:
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        return Agreement(
+            agreement_id="0x" + "a1" * 32,
+            payer_id=uuid.UUID(int=1),
+            payee_id=uuid.UUID(int=2),
+            arbitrator_id=None,
+            arbitration_policy=ArbitrationPolicy.NONE,
+            amount_wei=Decimal("1000000000000000000"),
+            status=AgreementStatus.FUNDED,
+            created_tx_hash=None,
+            funded_tx_hash="0x" + "b2" * 32,
+            released_tx_hash=None,
+            refunded_tx_hash=None,
+            created_onchain_at=None,
+            funded_at=now,
+            released_at=None,
+            refunded_at=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def test_from_orm_row_matches_model_validate(self) -> None:
+        """Should build the same response as validating from attributes."""
+        agreement = self._agreement()
+
+        response = AgreementResponse.from_orm_row(agreement)
+
+        assert response == AgreementResponse.model_validate(agreement)
+        assert response.amount_wei == 10**18
+
+    def test_from_orm_row_unloaded_field_falls_back(self) -> None:
+        """Should validate through the ORM when a column is not loaded."""
+        agreement = self._agreement()
+        del agreement.__dict__["updated_at"]
+
+        with patch.object(AgreementResponse, "model_validate") as mock_validate:
+            response = AgreementResponse.from_orm_row(agreement)
+
+        mock_validate.assert_called_once_with(agreement)
+        assert response is mock_validate.return_value
@@ -1,9 +1,13 @@
-"""Unit tests for AgreementService."""
+"""Unit tests for AgreementService.
+
+PYTEST_DONT_REWRITE
+"""
 
 import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -15,8 +19,24 @@ from src.modules.agreements.core.exceptions import (
     UnauthorizedAgreementAccessError,
     MaxDraftAgreementsError,
 )
-from src.modules.agreements.core.models import Agreement
 from src.modules.agreements.core.services import AgreementService
+from src.modules.users.core.exceptions import UserNotFoundError
+
+USER_1 = uuid.UUID(int=1)
+USER_2 = uuid.UUID(int=2)
+USER_3 = uuid.UUID(int=3)
+USER_999 = uuid.UUID(int=0x999)
+AMOUNT_1_ETH = 10**18
+AGREEMENT_ID_HEX = "0x" + "a1" * 32
+
+
+def _areturn(value: object) -> Callable[..., Awaitable[object]]:
+    """Build a plain coroutine function returning ``value`` (cheaper than AsyncMock)."""
+
+    async def _coro(*args: object, **kwargs: object) -> object:
+        return value
+
+    return _coro
 
 
 @pytest.fixture
@@ -39,28 +59,30 @@ def agreement_service(
     return AgreementService(mock_agreement_repo, mock_user_repo)
 
 
-@pytest.fixture
-def sample_agreement() -> Agreement:
-    """Create a sample agreement for testing."""
-    agreement = MagicMock(spec=Agreement)
-    agreement.agreement_id = "0x" + "a1" * 32
-    agreement.payer_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-    agreement.payee_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
-    agreement.arbitrator_id = None
-    agreement.arbitration_policy = ArbitrationPolicy.NONE
-    agreement.amount_wei = Decimal("1000000000000000000")
-    agreement.status = AgreementStatus.DRAFT
-    agreement.created_at = datetime(2026, 1, 1, tzinfo=UTC)
-    agreement.updated_at = datetime(2026, 1, 1, tzinfo=UTC)
-    return agreement
+@dataclass
+class _AgreementStub:
+    """Plain stand-in for Agreement carrying only the fields the service reads."""
+
+    agreement_id: str
+    payer_id: uuid.UUID
+    payee_id: uuid.UUID
+    arbitrator_id: uuid.UUID | None = None
+    arbitration_policy: ArbitrationPolicy = ArbitrationPolicy.NONE
+    amount_wei: int = 0
+    status: AgreementStatus = AgreementStatus.DRAFT
+    created_at: datetime = datetime(2026, 1, 1, tzinfo=UTC)
+    updated_at: datetime = datetime(2026, 1, 1, tzinfo=UTC)
 
 
 @pytest.fixture
-def sample_user() -> MagicMock:
-    """Create a sample user for testing."""
-    user = MagicMock()
-    user.id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-    return user
+def sample_agreement() -> _AgreementStub:
+    """Create a sample agreement for testing."""
+    return _AgreementStub(
+        agreement_id=AGREEMENT_ID_HEX,
+        payer_id=USER_1,
+        payee_id=USER_2,
+        amount_wei=AMOUNT_1_ETH,
+    )
 
 
 class TestCreateAgreement:
@@ -72,92 +94,106 @@ class TestCreateAgreement:
         agreement_service: AgreementService,
         mock_agreement_repo: MagicMock,
         mock_user_repo: MagicMock,
-        sample_agreement: Agreement,
-        sample_user: MagicMock,
+        sample_agreement: _AgreementStub,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Should create agreement successfully."""
-        payer_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-        payee_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
+        payer_id = USER_1
+        payee_id = USER_2
 
-        mock_user_repo.find_by_id = AsyncMock(return_value=sample_user)
+        mock_user_repo.exist_ids = AsyncMock(return_value={payer_id, payee_id})
         mock_agreement_repo.create = AsyncMock(return_value=sample_agreement)
-        mock_agreement_repo.count_by_user_and_status = AsyncMock(return_value=0)
-
-        with patch.object(
-            agreement_service,
-            "_generate_agreement_id",
-            return_value="0x" + "a1" * 32,
-        ):
-            result = await agreement_service.create_agreement(
-                payer_id=payer_id,
-                payee_id=payee_id,
-                amount_wei=Decimal("1000000000000000000"),
-                arbitration_policy=ArbitrationPolicy.NONE,
-            )
+        mock_agreement_repo.count_by_user_and_status = _areturn(0)
+
+        monkeypatch.setattr(
+            agreement_service, "_generate_agreement_id", lambda: AGREEMENT_ID_HEX
+        )
+
+        result = await agreement_service.create_agreement(
+            payer_id=payer_id,
+            payee_id=payee_id,
+            amount_wei=AMOUNT_1_ETH,
+            arbitration_policy=ArbitrationPolicy.NONE,
+        )
 
         assert result == sample_agreement
+        mock_user_repo.exist_ids.assert_awaited_once_with({payer_id, payee_id})
         mock_agreement_repo.create.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_create_agreement_self_deal(
+    async def test_create_agreement_user_not_found(
         self,
         agreement_service: AgreementService,
+        mock_agreement_repo: MagicMock,
+        mock_user_repo: MagicMock,
     ) -> None:
-        """Should raise SelfDealError when payer == payee."""
-        user_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+        """Should raise UserNotFoundError for the first participant that is missing."""
+        mock_agreement_repo.count_by_user_and_status = _areturn(0)
+        mock_user_repo.exist_ids = _areturn({USER_1})
 
-        with pytest.raises(SelfDealError) as exc_info:
+        with pytest.raises(UserNotFoundError) as exc_info:
             await agreement_service.create_agreement(
-                payer_id=user_id,
-                payee_id=user_id,
-                amount_wei=Decimal("1000000000000000000"),
-                arbitration_policy=ArbitrationPolicy.NONE,
+                payer_id=USER_1,
+                payee_id=USER_2,
+                amount_wei=AMOUNT_1_ETH,
+                arbitration_policy=ArbitrationPolicy.WITH_ARBITRATOR,
+                arbitrator_id=USER_3,
             )
 
-        assert str(user_id) in str(exc_info.value)
+        assert exc_info.value.identifier == str(USER_2)
+        mock_agreement_repo.create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_create_agreement_policy_none_with_arbitrator(
+    @pytest.mark.parametrize(
+        ("payee_id", "policy", "arbitrator_id", "expected_exc", "expected_attrs"),
+        [
+            pytest.param(
+                USER_1,
+                ArbitrationPolicy.NONE,
+                None,
+                SelfDealError,
+                {"user_id": str(USER_1)},
+                id="self_deal",
+            ),
+            pytest.param(
+                USER_2,
+                ArbitrationPolicy.NONE,
+                USER_3,
+                InvalidArbitrationPolicyError,
+                {"policy": ArbitrationPolicy.NONE, "has_arbitrator": True},
+                id="policy_none_with_arbitrator",
+            ),
+            pytest.param(
+                USER_2,
+                ArbitrationPolicy.WITH_ARBITRATOR,
+                None,
+                InvalidArbitrationPolicyError,
+                {"policy": ArbitrationPolicy.WITH_ARBITRATOR, "has_arbitrator": False},
+                id="policy_arbitrator_without_arbitrator",
+            ),
+        ],
+    )
+    async def test_create_agreement_validation_errors(
         self,
         agreement_service: AgreementService,
+        payee_id: uuid.UUID,
+        policy: ArbitrationPolicy,
+        arbitrator_id: uuid.UUID | None,
+        expected_exc: type[Exception],
+        expected_attrs: dict[str, object],
     ) -> None:
-        """Should fail when policy is NONE but arbitrator is provided."""
-        payer_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-        payee_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
-        arbitrator_id = uuid.UUID("00000000-0000-0000-0000-000000000003")
-
-        with pytest.raises(InvalidArbitrationPolicyError) as exc_info:
+        """Should reject self-deals and inconsistent arbitration policies."""
+        with pytest.raises(expected_exc) as exc_info:
             await agreement_service.create_agreement(
-                payer_id=payer_id,
+                payer_id=USER_1,
                 payee_id=payee_id,
-                amount_wei=Decimal("1000000000000000000"),
-                arbitration_policy=ArbitrationPolicy.NONE,
+                amount_wei=AMOUNT_1_ETH,
+                arbitration_policy=policy,
                 arbitrator_id=arbitrator_id,
             )
 
-        assert exc_info.value.policy == ArbitrationPolicy.NONE
-        assert exc_info.value.has_arbitrator is True
-
-    @pytest.mark.asyncio
-    async def test_create_agreement_policy_arbitrator_without_arbitrator(
-        self,
-        agreement_service: AgreementService,
-    ) -> None:
-        """Should fail when policy is WITH_ARBITRATOR but no arbitrator provided."""
-        payer_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-        payee_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
-
-        with pytest.raises(InvalidArbitrationPolicyError) as exc_info:
-            await agreement_service.create_agreement(
-                payer_id=payer_id,
-                payee_id=payee_id,
-                amount_wei=Decimal("1000000000000000000"),
-                arbitration_policy=ArbitrationPolicy.WITH_ARBITRATOR,
-                arbitrator_id=None,
-            )
-
-        assert exc_info.value.policy == ArbitrationPolicy.WITH_ARBITRATOR
-        assert exc_info.value.has_arbitrator is False
+        for attr, value in expected_attrs.items():
+            assert getattr(exc_info.value, attr) == value
 
     @pytest.mark.asyncio
     async def test_create_agreement_max_drafts_reached(
@@ -166,16 +202,16 @@ class TestCreateAgreement:
         mock_agreement_repo: MagicMock,
     ) -> None:
         """Should raise MaxDraftAgreementsError when draft limit is reached."""
-        payer_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-        payee_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
+        payer_id = USER_1
+        payee_id = USER_2
 
-        mock_agreement_repo.count_by_user_and_status = AsyncMock(return_value=30)
+        mock_agreement_repo.count_by_user_and_status = _areturn(30)
 
         with pytest.raises(MaxDraftAgreementsError) as exc_info:
             await agreement_service.create_agreement(
                 payer_id=payer_id,
                 payee_id=payee_id,
-                amount_wei=Decimal("1000000000000000000"),
+                amount_wei=AMOUNT_1_ETH,
                 arbitration_policy=ArbitrationPolicy.NONE,
             )
 
@@ -191,10 +227,10 @@ class TestGetAgreementById:
         self,
         agreement_service: AgreementService,
         mock_agreement_repo: MagicMock,
-        sample_agreement: Agreement,
+        sample_agreement: _AgreementStub,
     ) -> None:
         """Should return agreement when user is participant."""
-        mock_agreement_repo.find_by_id = AsyncMock(return_value=sample_agreement)
+        mock_agreement_repo.find_by_id_for_participant = _areturn(sample_agreement)
 
         result = await agreement_service.get_agreement_by_id(
             agreement_id=sample_agreement.agreement_id,
@@ -210,13 +246,14 @@ class TestGetAgreementById:
         mock_agreement_repo: MagicMock,
     ) -> None:
         """Should raise AgreementNotFoundError when agreement doesn't exist."""
-        mock_agreement_repo.find_by_id = AsyncMock(return_value=None)
+        mock_agreement_repo.find_by_id_for_participant = _areturn(None)
+        mock_agreement_repo.exists = _areturn(False)
         agreement_id = "0x" + "ff" * 32
 
         with pytest.raises(AgreementNotFoundError) as exc_info:
             await agreement_service.get_agreement_by_id(
                 agreement_id=agreement_id,
-                user_id=uuid.UUID("00000000-0000-0000-0000-000000000001"),
+                user_id=USER_1,
             )
 
         assert exc_info.value.agreement_id == agreement_id
@@ -226,11 +263,12 @@ class TestGetAgreementById:
         self,
         agreement_service: AgreementService,
         mock_agreement_repo: MagicMock,
-        sample_agreement: Agreement,
+        sample_agreement: _AgreementStub,
     ) -> None:
         """Should raise UnauthorizedAgreementAccessError for non-participants."""
-        mock_agreement_repo.find_by_id = AsyncMock(return_value=sample_agreement)
-        non_participant_id = uuid.UUID("00000000-0000-0000-0000-000000000999")
+        mock_agreement_repo.find_by_id_for_participant = _areturn(None)
+        mock_agreement_repo.exists = _areturn(True)
+        non_participant_id = USER_999
 
         with pytest.raises(UnauthorizedAgreementAccessError) as exc_info:
             await agreement_service.get_agreement_by_id(
@@ -249,10 +287,10 @@ class TestListUserAgreements:
         self,
         agreement_service: AgreementService,
         mock_agreement_repo: MagicMock,
-        sample_agreement: Agreement,
+        sample_agreement: _AgreementStub,
     ) -> None:
         """Should return list of agreements and total count."""
-        user_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+        user_id = USER_1
         mock_agreement_repo.list_by_user = AsyncMock(
             return_value=([sample_agreement], 1)
         )
@@ -265,7 +303,7 @@ class TestListUserAgreements:
 
         assert items == [sample_agreement]
         assert total == 1
-        mock_agreement_repo.list_by_user.assert_awaited_with(user_id, None, 10, 0)
+        mock_agreement_repo.list_by_user.assert_awaited_with(user_id, None, 10, 0, None)
 
     @pytest.mark.asyncio
     async def test_list_user_agreements_pagination(
@@ -274,7 +312,7 @@ class TestListUserAgreements:
         mock_agreement_repo: MagicMock,
     ) -> None:
         """Should calculate offset correctly based on page and page_size."""
-        user_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+        user_id = USER_1
         mock_agreement_repo.list_by_user = AsyncMock(return_value=([], 0))
 
         await agreement_service.list_user_agreements(
@@ -284,4 +322,25 @@ class TestListUserAgreements:
         )
 
         # page 3, size 20 -> offset should be (3-1)*20 = 40
-        mock_agreement_repo.list_by_user.assert_awaited_with(user_id, None, 20, 40)
+        mock_agreement_repo.list_by_user.assert_awaited_with(
+            user_id, None, 20, 40, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_user_agreements_keyset(
+        self,
+        agreement_service: AgreementService,
+        mock_agreement_repo: MagicMock,
+    ) -> None:
+        """Should seek from the cursor key instead of applying a page offset."""
+        after = (datetime(2026, 1, 1, tzinfo=UTC), AGREEMENT_ID_HEX)
+        mock_agreement_repo.list_by_user = AsyncMock(return_value=([], 0))
+
+        await agreement_service.list_user_agreements(
+            user_id=USER_1,
+            page=3,
+            page_size=20,
+            after=after,
+        )
+
+        mock_agreement_repo.list_by_user.assert_awaited_with(USER_1, None, 20, 0, after)
@@ -1,9 +1,9 @@
 """Agreement enums matching database ENUMs."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class ArbitrationPolicy(str, Enum):
+class ArbitrationPolicy(StrEnum):
     """Arbitration policy for an agreement.
 
     NONE: No arbitrator, only payer can release payment.
@@ -14,7 +14,7 @@ class ArbitrationPolicy(str, Enum):
     WITH_ARBITRATOR = "WITH_ARBITRATOR"
 
 
-class AgreementStatus(str, Enum):
+class AgreementStatus(StrEnum):
     """Status of an agreement in its lifecycle.
 
     DRAFT: Initial state, agreement created off-chain.
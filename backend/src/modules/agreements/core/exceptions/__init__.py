@@ -2,6 +2,7 @@
 
 from src.modules.agreements.core.exceptions.agreement_exceptions import (
     AgreementNotFoundError,
+    InvalidAgreementCursorError,
     InvalidArbitrationPolicyError,
     SelfDealError,
     UnauthorizedAgreementAccessError,
@@ -14,4 +15,5 @@ __all__ = [
     "InvalidArbitrationPolicyError",
     "UnauthorizedAgreementAccessError",
     "MaxDraftAgreementsError",
+    "InvalidAgreementCursorError",
 ]
@@ -1,28 +1,47 @@
 """Agreement domain exceptions."""
 
-
-from src.modules.agreements.core.enums import AgreementStatus, ArbitrationPolicy
+from src.modules.agreements.core.enums import ArbitrationPolicy
 
 
 class AgreementNotFoundError(Exception):
     """Raised when an agreement is not found."""
 
+    __slots__ = ("agreement_id",)
+
     def __init__(self, agreement_id: str) -> None:
         self.agreement_id = agreement_id
-        super().__init__(f"Agreement not found: {agreement_id}")
+        super().__init__(agreement_id)
+
+    def __str__(self) -> str:
+        return f"Agreement not found: {self.agreement_id}"
 
 
 class SelfDealError(Exception):
     """Raised when payer and payee are the same user."""
 
+    __slots__ = ("user_id",)
+
     def __init__(self, user_id: str) -> None:
         self.user_id = user_id
-        super().__init__(f"Payer and payee cannot be the same user: {user_id}")
+        super().__init__(user_id)
+
+    def __str__(self) -> str:
+        return f"Payer and payee cannot be the same user: {self.user_id}"
+
+
+_POLICY_MSG: dict[tuple[ArbitrationPolicy, bool], str] = {
+    (ArbitrationPolicy.NONE, True): "Policy NONE cannot have an arbitrator",
+    (ArbitrationPolicy.WITH_ARBITRATOR, False): (
+        "Policy WITH_ARBITRATOR requires an arbitrator"
+    ),
+}
 
 
 class InvalidArbitrationPolicyError(Exception):
     """Raised when arbitration policy constraints are violated."""
 
+    __slots__ = ("policy", "has_arbitrator")
+
     def __init__(
         self,
         policy: ArbitrationPolicy,
@@ -30,32 +49,54 @@ class InvalidArbitrationPolicyError(Exception):
     ) -> None:
         self.policy = policy
         self.has_arbitrator = has_arbitrator
-        if policy == ArbitrationPolicy.NONE and has_arbitrator:
-            message = "Policy NONE cannot have an arbitrator"
-        elif policy == ArbitrationPolicy.WITH_ARBITRATOR and not has_arbitrator:
-            message = "Policy WITH_ARBITRATOR requires an arbitrator"
-        else:
-            message = f"Invalid arbitration policy configuration: {policy.value}"
+        message = _POLICY_MSG.get((policy, has_arbitrator)) or (
+            f"Invalid arbitration policy configuration: {policy}"
+        )
         super().__init__(message)
 
 
 class UnauthorizedAgreementAccessError(Exception):
     """Raised when a user attempts to access an agreement they're not part of."""
 
+    __slots__ = ("user_id", "agreement_id")
+
     def __init__(self, user_id: str, agreement_id: str) -> None:
         self.user_id = user_id
         self.agreement_id = agreement_id
-        super().__init__(
-            f"User {user_id} is not authorized to access agreement {agreement_id}"
+        super().__init__(user_id, agreement_id)
+
+    def __str__(self) -> str:
+        return (
+            f"User {self.user_id} is not authorized to access agreement "
+            f"{self.agreement_id}"
         )
 
 
 class MaxDraftAgreementsError(Exception):
     """Raised when a user exceeds the maximum number of draft agreements."""
 
+    __slots__ = ("user_id", "max_drafts")
+
     def __init__(self, user_id: str, max_drafts: int) -> None:
         self.user_id = user_id
         self.max_drafts = max_drafts
-        super().__init__(
-            f"User {user_id} has reached the maximum of {max_drafts} draft agreements"
+        super().__init__(user_id, max_drafts)
+
+    def __str__(self) -> str:
+        return (
+            f"User {self.user_id} has reached the maximum of {self.max_drafts} "
+            "draft agreements"
         )
+
+
+class InvalidAgreementCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    __slots__ = ("cursor",)
+
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        super().__init__(cursor)
+
+    def __str__(self) -> str:
+        return f"Invalid agreements cursor: {self.cursor}"
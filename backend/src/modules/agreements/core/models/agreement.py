@@ -1,24 +1,32 @@
 """Agreement domain model"""
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
+from functools import cached_property
 
 from sqlalchemy import (
     CheckConstraint,
+    Computed,
     DateTime,
+    Enum,
     ForeignKey,
     Index,
     Numeric,
-    String,
     Text,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.modules.agreements.core.enums import AgreementStatus, ArbitrationPolicy
 from src.shared.database.base import Base
+from src.shared.database.types import HexBinary
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
 
 
 class Agreement(Base):
@@ -26,9 +34,9 @@ class Agreement(Base):
 
     __tablename__ = "agreements"
 
-    # Primary key: bytes32 identifier from smart contract (hex string)
+    # Primary key: bytes32 identifier from smart contract (hex string in Python)
     agreement_id: Mapped[str] = mapped_column(
-        String(66),
+        HexBinary,
         primary_key=True,
         autoincrement=False,
     )
@@ -49,10 +57,19 @@ class Agreement(Base):
         ForeignKey("users.id"),
         nullable=True,
     )
+    # All participants in one GIN-indexed array, so "user takes part in the
+    # agreement" is a single containment lookup. Only used in WHERE clauses,
+    # so it is never selected.
+    participant_ids: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)),
+        Computed("ARRAY[payer_id, payee_id, arbitrator_id]", persisted=True),
+        deferred=True,
+        deferred_raiseload=True,
+    )
 
     # Agreement details
     arbitration_policy: Mapped[ArbitrationPolicy] = mapped_column(
-        ENUM(ArbitrationPolicy, name="arbitration_policy_enum", create_type=False),
+        Enum(ArbitrationPolicy, native_enum=False, length=32),
         nullable=False,
     )
     amount_wei: Mapped[Decimal] = mapped_column(
@@ -60,7 +77,7 @@ class Agreement(Base):
         nullable=False,
     )
     status: Mapped[AgreementStatus] = mapped_column(
-        ENUM(AgreementStatus, name="agreement_status_enum", create_type=False),
+        Enum(AgreementStatus, native_enum=False, length=32),
         nullable=False,
         server_default="DRAFT",
     )
@@ -86,24 +103,41 @@ class Agreement(Base):
     )
 
     # Database timestamps
+    # Stamped in Python so the value is bound like any other parameter;
+    # server_default still covers rows inserted outside the ORM.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=_utcnow,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=_utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
     )
 
-    # Relationships
-    payer = relationship("User", foreign_keys=[payer_id], lazy="joined")
-    payee = relationship("User", foreign_keys=[payee_id], lazy="joined")
-    arbitrator = relationship("User", foreign_keys=[arbitrator_id], lazy="joined")
+    # Relationships (never loaded implicitly; opt in with loader options)
+    payer = relationship("User", foreign_keys=[payer_id], lazy="raise")
+    payee = relationship("User", foreign_keys=[payee_id], lazy="raise")
+    arbitrator = relationship("User", foreign_keys=[arbitrator_id], lazy="raise")
 
     __table_args__ = (
+        CheckConstraint(
+            "arbitration_policy IN ('NONE', 'WITH_ARBITRATOR')",
+            name="ck_agreements_arbitration_policy",
+        ),
+        CheckConstraint(
+            "status IN ('DRAFT', 'CREATED', 'FUNDED', 'DISPUTED', 'RELEASED', "
+            "'REFUNDED')",
+            name="ck_agreements_status",
+        ),
+        CheckConstraint(
+            "octet_length(agreement_id) = 32",
+            name="ck_agreements_agreement_id_length",
+        ),
         CheckConstraint("payer_id <> payee_id", name="ck_agreements_no_self_deal"),
         CheckConstraint("amount_wei > 0", name="ck_agreements_positive_amount"),
         CheckConstraint(
@@ -111,12 +145,54 @@ class Agreement(Base):
             "(arbitration_policy = 'WITH_ARBITRATOR' AND arbitrator_id IS NOT NULL)",
             name="ck_agreements_policy_arbitrator",
         ),
-        Index("idx_agreements_status", "status"),
+        # Role-specific lookups (e.g. the payer draft count) and FK checks
+        Index(
+            "idx_agreements_payer_status_created",
+            "payer_id",
+            "status",
+            text("created_at DESC"),
+        ),
+        Index(
+            "idx_agreements_payee_status_created",
+            "payee_id",
+            "status",
+            text("created_at DESC"),
+        ),
+        Index(
+            "idx_agreements_arbitrator_status_created",
+            "arbitrator_id",
+            "status",
+            text("created_at DESC"),
+            postgresql_where=text("arbitrator_id IS NOT NULL"),
+        ),
+        Index(
+            "idx_agreements_participant_ids",
+            "participant_ids",
+            postgresql_using="gin",
+        ),
+        Index(
+            "idx_agreements_disputed",
+            "updated_at",
+            postgresql_where=text("status = 'DISPUTED'"),
+        ),
     )
 
+    @cached_property
+    def participants(self) -> frozenset[uuid.UUID]:
+        """IDs of the payer, payee and (if any) arbitrator.
+
+        Participants are fixed at creation, so the set is computed once per
+        instance.
+        """
+        return frozenset(
+            user_id
+            for user_id in (self.payer_id, self.payee_id, self.arbitrator_id)
+            if user_id is not None
+        )
+
     def __repr__(self) -> str:
         return (
             f"<Agreement(id={self.agreement_id}, "
-            f"status={self.status.value}, "
+            f"status={self.status}, "
             f"amount_wei={self.amount_wei})>"
         )
@@ -1,8 +1,8 @@
 """Agreement service implementing business logic."""
 
-import secrets
+import os
 import uuid
-from decimal import Decimal
+from datetime import datetime
 
 from src.modules.agreements.core.enums import AgreementStatus, ArbitrationPolicy
 from src.modules.agreements.core.exceptions import (
@@ -17,6 +17,8 @@ from src.modules.agreements.persistence import AgreementRepository
 from src.modules.users.core.exceptions import UserNotFoundError
 from src.modules.users.persistence import UserRepository
 
+MAX_DRAFT_AGREEMENTS = 30
+
 
 class AgreementService:
     """Service class for agreement-related business logic."""
@@ -41,44 +43,27 @@ class AgreementService:
         Returns:
             A random 256-bit identifier as '0x' + 64 hex chars.
         """
-        return "0x" + secrets.token_bytes(32).hex()
-
-    def _is_participant(self, agreement: Agreement, user_id: uuid.UUID) -> bool:
-        """Check if a user is a participant in an agreement.
-
-        A participant is the payer, payee, or arbitrator.
-
-        Args:
-            agreement: The agreement to check.
-            user_id: The user ID to check.
-
-        Returns:
-            True if the user is a participant, False otherwise.
-        """
-        return user_id in (
-            agreement.payer_id,
-            agreement.payee_id,
-            agreement.arbitrator_id,
-        )
+        return f"0x{os.urandom(32).hex()}"
 
-    async def _validate_user_exists(self, user_id: uuid.UUID) -> None:
-        """Validate that a user exists.
+    async def _validate_users_exist(self, *user_ids: uuid.UUID) -> None:
+        """Validate that all given users exist, using a single query.
 
         Args:
-            user_id: The user ID to validate.
+            user_ids: The user IDs to validate, in reporting order.
 
         Raises:
-            UserNotFoundError: If the user does not exist.
+            UserNotFoundError: For the first user ID that does not exist.
         """
-        user = await self._user_repo.find_by_id(user_id)
-        if user is None:
-            raise UserNotFoundError(str(user_id))
+        existing = await self._user_repo.exist_ids(set(user_ids))
+        for user_id in user_ids:
+            if user_id not in existing:
+                raise UserNotFoundError(str(user_id))
 
     async def create_agreement(
         self,
         payer_id: uuid.UUID,
         payee_id: uuid.UUID,
-        amount_wei: Decimal,
+        amount_wei: int,
         arbitration_policy: ArbitrationPolicy,
         arbitrator_id: uuid.UUID | None = None,
     ) -> Agreement:
@@ -104,13 +89,13 @@ class AgreementService:
             raise SelfDealError(str(payer_id))
 
         # Validate arbitration policy constraints
-        if arbitration_policy == ArbitrationPolicy.NONE and arbitrator_id is not None:
+        if arbitration_policy is ArbitrationPolicy.NONE and arbitrator_id is not None:
             raise InvalidArbitrationPolicyError(
                 policy=arbitration_policy,
                 has_arbitrator=True,
             )
         if (
-            arbitration_policy == ArbitrationPolicy.WITH_ARBITRATOR
+            arbitration_policy is ArbitrationPolicy.WITH_ARBITRATOR
             and arbitrator_id is None
         ):
             raise InvalidArbitrationPolicyError(
@@ -119,17 +104,18 @@ class AgreementService:
             )
 
         # Validate draft limit
+        # Only whether the limit is reached matters, so stop counting there
         draft_count = await self._agreement_repo.count_by_user_and_status(
-            payer_id, AgreementStatus.DRAFT
+            payer_id, AgreementStatus.DRAFT, cap=MAX_DRAFT_AGREEMENTS
         )
-        if draft_count >= 30:
-            raise MaxDraftAgreementsError(str(payer_id), 30)
+        if draft_count >= MAX_DRAFT_AGREEMENTS:
+            raise MaxDraftAgreementsError(str(payer_id), MAX_DRAFT_AGREEMENTS)
 
         # Validate all users exist
-        await self._validate_user_exists(payer_id)
-        await self._validate_user_exists(payee_id)
-        if arbitrator_id is not None:
-            await self._validate_user_exists(arbitrator_id)
+        if arbitrator_id is None:
+            await self._validate_users_exist(payer_id, payee_id)
+        else:
+            await self._validate_users_exist(payer_id, payee_id, arbitrator_id)
 
         # Generate unique agreement ID
         agreement_id = self._generate_agreement_id()
@@ -164,14 +150,16 @@ class AgreementService:
             AgreementNotFoundError: If the agreement is not found.
             UnauthorizedAgreementAccessError: If user is not a participant.
         """
-        agreement = await self._agreement_repo.find_by_id(agreement_id)
-        if agreement is None:
-            raise AgreementNotFoundError(agreement_id)
-
-        if not self._is_participant(agreement, user_id):
-            raise UnauthorizedAgreementAccessError(str(user_id), agreement_id)
+        agreement = await self._agreement_repo.find_by_id_for_participant(
+            agreement_id, user_id
+        )
+        if agreement is not None:
+            return agreement
 
-        return agreement
+        # Only the failure path pays for telling "missing" from "forbidden"
+        if not await self._agreement_repo.exists(agreement_id):
+            raise AgreementNotFoundError(agreement_id)
+        raise UnauthorizedAgreementAccessError(str(user_id), agreement_id)
 
     async def list_user_agreements(
         self,
@@ -179,14 +167,16 @@ class AgreementService:
         status_filter: AgreementStatus | None = None,
         page: int = 1,
         page_size: int = 10,
+        after: tuple[datetime, str] | None = None,
     ) -> tuple[list[Agreement], int]:
         """List all agreements where the user is a participant.
 
         Args:
             user_id: The user's UUID.
             status_filter: Optional status to filter by.
-            page: Page number (1-based).
+            page: Page number (1-based). Ignored when ``after`` is given.
             page_size: Number of items per page.
+            after: Optional (created_at, agreement_id) keyset to continue after.
 
         Returns:
             A tuple containing:
@@ -194,8 +184,8 @@ class AgreementService:
             - Total count of agreements.
         """
         limit = page_size
-        offset = (page - 1) * page_size
+        offset = 0 if after is not None else (page - 1) * page_size
 
         return await self._agreement_repo.list_by_user(
-            user_id, status_filter, limit, offset
+            user_id, status_filter, limit, offset, after
         )
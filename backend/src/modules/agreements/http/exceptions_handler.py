@@ -3,17 +3,112 @@
 Converts domain exceptions to appropriate HTTP responses.
 """
 
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from src.modules.agreements.core.exceptions import (
     AgreementNotFoundError,
+    InvalidAgreementCursorError,
     InvalidArbitrationPolicyError,
     SelfDealError,
     UnauthorizedAgreementAccessError,
     MaxDraftAgreementsError,
 )
 
+# Static error bodies are serialized once instead of per raised exception
+_UNAUTHORIZED_AGREEMENT_ACCESS_BODY = b'{"error_code":"UNAUTHORIZED_AGREEMENT_ACCESS"}'
+
+
+async def agreement_not_found_handler(
+    request: Request, exc: AgreementNotFoundError
+) -> JSONResponse:
+    """Handle AgreementNotFoundError exceptions."""
+    return JSONResponse(
+        status_code=404,
+        content={
+            "detail": str(exc),
+            "error_code": "AGREEMENT_NOT_FOUND",
+        },
+    )
+
+
+async def self_deal_handler(request: Request, exc: SelfDealError) -> JSONResponse:
+    """Handle SelfDealError exceptions."""
+    return JSONResponse(
+        status_code=400,
+        content={
+            "detail": str(exc),
+            "error_code": "SELF_DEAL",
+        },
+    )
+
+
+async def invalid_arbitration_policy_handler(
+    request: Request, exc: InvalidArbitrationPolicyError
+) -> JSONResponse:
+    """Handle InvalidArbitrationPolicyError exceptions."""
+    return JSONResponse(
+        status_code=400,
+        content={
+            "detail": str(exc),
+            "error_code": "INVALID_ARBITRATION_POLICY",
+            "policy": exc.policy.value,
+        },
+    )
+
+
+async def unauthorized_agreement_access_handler(
+    request: Request, exc: UnauthorizedAgreementAccessError
+) -> Response:
+    """Handle UnauthorizedAgreementAccessError exceptions."""
+    return Response(
+        content=_UNAUTHORIZED_AGREEMENT_ACCESS_BODY,
+        status_code=403,
+        media_type="application/json",
+    )
+
+
+async def max_draft_agreements_handler(
+    request: Request, exc: MaxDraftAgreementsError
+) -> JSONResponse:
+    """Handle MaxDraftAgreementsError exceptions."""
+    return JSONResponse(
+        status_code=422,
+        content={
+            "detail": str(exc),
+            "error_code": "MAX_DRAFT_AGREEMENTS_REACHED",
+            "max_drafts": exc.max_drafts,
+        },
+    )
+
+
+async def invalid_agreement_cursor_handler(
+    request: Request, exc: InvalidAgreementCursorError
+) -> JSONResponse:
+    """Handle InvalidAgreementCursorError exceptions."""
+    return JSONResponse(
+        status_code=400,
+        content={
+            "detail": str(exc),
+            "error_code": "INVALID_CURSOR",
+        },
+    )
+
+
+HANDLERS: tuple[
+    tuple[type[Exception], Callable[[Request, Any], Awaitable[Response]]], ...
+] = (
+    (AgreementNotFoundError, agreement_not_found_handler),
+    (SelfDealError, self_deal_handler),
+    (InvalidArbitrationPolicyError, invalid_arbitration_policy_handler),
+    (UnauthorizedAgreementAccessError, unauthorized_agreement_access_handler),
+    (MaxDraftAgreementsError, max_draft_agreements_handler),
+    (InvalidAgreementCursorError, invalid_agreement_cursor_handler),
+)
+
 
 def register_agreements_exception_handlers(app: FastAPI) -> None:
     """Register exception handlers for the agreements module.
@@ -21,69 +116,5 @@ def register_agreements_exception_handlers(app: FastAPI) -> None:
     Args:
         app: The FastAPI application instance.
     """
-
-    @app.exception_handler(AgreementNotFoundError)
-    async def agreement_not_found_handler(
-        request: Request, exc: AgreementNotFoundError
-    ) -> JSONResponse:
-        """Handle AgreementNotFoundError exceptions."""
-        return JSONResponse(
-            status_code=404,
-            content={
-                "detail": str(exc),
-                "error_code": "AGREEMENT_NOT_FOUND",
-            },
-        )
-
-    @app.exception_handler(SelfDealError)
-    async def self_deal_handler(
-        request: Request, exc: SelfDealError
-    ) -> JSONResponse:
-        """Handle SelfDealError exceptions."""
-        return JSONResponse(
-            status_code=400,
-            content={
-                "detail": str(exc),
-                "error_code": "SELF_DEAL",
-            },
-        )
-
-    @app.exception_handler(InvalidArbitrationPolicyError)
-    async def invalid_arbitration_policy_handler(
-        request: Request, exc: InvalidArbitrationPolicyError
-    ) -> JSONResponse:
-        """Handle InvalidArbitrationPolicyError exceptions."""
-        return JSONResponse(
-            status_code=400,
-            content={
-                "detail": str(exc),
-                "error_code": "INVALID_ARBITRATION_POLICY",
-                "policy": exc.policy.value,
-            },
-        )
-
-    @app.exception_handler(UnauthorizedAgreementAccessError)
-    async def unauthorized_agreement_access_handler(
-        request: Request, exc: UnauthorizedAgreementAccessError
-    ) -> JSONResponse:
-        """Handle UnauthorizedAgreementAccessError exceptions."""
-        return JSONResponse(
-            status_code=403,
-            content={
-                "error_code": "UNAUTHORIZED_AGREEMENT_ACCESS",
-            },
-        )
-
-    @app.exception_handler(MaxDraftAgreementsError)
-    async def max_draft_agreements_handler(
-        request: Request, exc: MaxDraftAgreementsError
-    ) -> JSONResponse:
-        """Handle MaxDraftAgreementsError exceptions."""
-        return JSONResponse(
-            status_code=422,
-            content={
-                "detail": str(exc),
-                "error_code": "MAX_DRAFT_AGREEMENTS_REACHED",
-                "max_drafts": exc.max_drafts,
-            },
-        )
+    for exc_class, handler in HANDLERS:
+        app.add_exception_handler(exc_class, handler)
@@ -10,9 +10,12 @@ from src.modules.agreements.core.enums import AgreementStatus
 from src.modules.agreements.core.services import AgreementService
 from src.modules.agreements.module import get_agreement_service
 from src.modules.agreements.schemas import (
+    AgreementId,
     AgreementListResponse,
     AgreementResponse,
     CreateAgreementRequest,
+    decode_agreement_cursor,
+    encode_agreement_cursor,
 )
 from src.modules.auth.module import get_current_user_id
 
@@ -58,15 +61,26 @@ async def list_agreements(
     ] = None,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 10,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor from the previous page (overrides page)"),
+    ] = None,
 ) -> AgreementListResponse:
     """List all agreements where the user is a participant."""
+    after = decode_agreement_cursor(cursor) if cursor is not None else None
     agreements, total = await service.list_user_agreements(
-        user_id, status, page, page_size
+        user_id, status, page, page_size, after
     )
 
+    next_cursor = None
+    if len(agreements) == page_size:
+        last = agreements[-1]
+        next_cursor = encode_agreement_cursor(last.created_at, last.agreement_id)
+
     return AgreementListResponse(
-        items=[AgreementResponse.model_validate(a) for a in agreements],
+        items=[AgreementResponse.from_orm_row(agreement) for agreement in agreements],
         total=total,
+        next_cursor=next_cursor,
     )
 
 
@@ -77,12 +91,12 @@ async def list_agreements(
     description="Get an agreement by its ID. User must be a participant.",
 )
 async def get_agreement(
-    agreement_id: str,
+    agreement_id: AgreementId,
     service: Annotated[AgreementService, Depends(get_agreement_service)],
     user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
 ) -> AgreementResponse:
     """Get an agreement by ID."""
     agreement = await service.get_agreement_by_id(agreement_id, user_id)
 
-    return AgreementResponse.model_validate(agreement)
+    return AgreementResponse.from_orm_row(agreement)
 
@@ -8,7 +8,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.agreements.core.services import AgreementService
 from src.modules.agreements.persistence import AgreementRepository
-from src.modules.users import get_user_repository
 from src.modules.users.persistence import UserRepository
 from src.shared.database.session import get_session
 
@@ -28,18 +27,17 @@ async def get_agreement_repository(
 
 
 async def get_agreement_service(
-    agreement_repository: Annotated[
-        AgreementRepository, Depends(get_agreement_repository)
-    ],
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> AsyncGenerator[AgreementService, None]:
     """Dependency that provides an AgreementService.
 
+    Both repositories are built inline on the request's session, so resolving
+    the service needs no further repository dependencies.
+
     Args:
-        agreement_repository: The agreement repository.
-        user_repository: The user repository for validating user existence.
+        session: The async database session.
 
     Yields:
         An AgreementService instance.
     """
-    yield AgreementService(agreement_repository, user_repository)
+    yield AgreementService(AgreementRepository(session), UserRepository(session))
@@ -1,14 +1,74 @@
 """Agreement repository for database access."""
 
 import uuid
-from decimal import Decimal
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    bindparam,
+    exists,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID, array
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from src.modules.agreements.core.enums import AgreementStatus, ArbitrationPolicy
 from src.modules.agreements.core.models import Agreement
 
+# Hot-path statements are built once; callers only supply bind values
+_FIND_BY_ID = select(Agreement).where(
+    Agreement.agreement_id == bindparam("agreement_id")
+)
+_COUNT_BY_PAYER_AND_STATUS = select(func.count()).where(
+    Agreement.payer_id == bindparam("user_id"),
+    Agreement.status == bindparam("status"),
+)
+# Stops scanning after :cap matching index entries
+_CAPPED_COUNT_BY_PAYER_AND_STATUS = select(func.count()).select_from(
+    select(Agreement.agreement_id)
+    .where(
+        Agreement.payer_id == bindparam("user_id"),
+        Agreement.status == bindparam("status"),
+    )
+    .limit(bindparam("cap"))
+    .subquery()
+)
+
+
+def _participant_clause(
+    user_id: uuid.UUID | ColumnElement[uuid.UUID],
+) -> ColumnElement[bool]:
+    """Build the predicate matching agreements the user participates in."""
+    # participant_ids @> ARRAY[user_id] is answered by the GIN index
+    return Agreement.participant_ids.contains(array([user_id]))
+
+
+def _participant_loaders() -> tuple[LoaderOption, ...]:
+    """Build the opt-in eager loaders for the payer, payee and arbitrator users.
+
+    Each relationship is fetched with one ``IN`` query, whatever the page size.
+    Built per call because creating them configures the mappers, which needs
+    the User model to be registered.
+    """
+    return (
+        selectinload(Agreement.payer),
+        selectinload(Agreement.payee),
+        selectinload(Agreement.arbitrator),
+    )
+
+
+_FIND_BY_ID_FOR_PARTICIPANT = select(Agreement).where(
+    Agreement.agreement_id == bindparam("agreement_id"),
+    _participant_clause(bindparam("user_id", type_=UUID(as_uuid=True))),
+)
+_EXISTS = select(exists().where(Agreement.agreement_id == bindparam("agreement_id")))
+
 
 class AgreementRepository:
     """Repository class for Agreement data access operations."""
@@ -26,7 +86,7 @@ class AgreementRepository:
         agreement_id: str,
         payer_id: uuid.UUID,
         payee_id: uuid.UUID,
-        amount_wei: Decimal,
+        amount_wei: int,
         arbitration_policy: ArbitrationPolicy,
         arbitrator_id: uuid.UUID | None = None,
     ) -> Agreement:
@@ -56,35 +116,79 @@ class AgreementRepository:
         await self._session.flush()
         return agreement
 
-    async def find_by_id(self, agreement_id: str) -> Agreement | None:
+    async def find_by_id(
+        self, agreement_id: str, with_participants: bool = False
+    ) -> Agreement | None:
         """Find an agreement by its ID.
 
         Args:
             agreement_id: The agreement identifier.
+            with_participants: Whether to eager-load the payer, payee and
+                arbitrator users.
 
         Returns:
             The Agreement entity if found, None otherwise.
         """
-        stmt = select(Agreement).where(Agreement.agreement_id == agreement_id)
-        result = await self._session.execute(stmt)
+        stmt = _FIND_BY_ID
+        if with_participants:
+            stmt = stmt.options(*_participant_loaders())
+        result = await self._session.execute(stmt, {"agreement_id": agreement_id})
+        return result.scalar_one_or_none()
+
+    async def find_by_id_for_participant(
+        self, agreement_id: str, user_id: uuid.UUID
+    ) -> Agreement | None:
+        """Find an agreement by its ID if the user is one of its participants.
+
+        Args:
+            agreement_id: The agreement identifier.
+            user_id: The user's UUID (payer, payee, or arbitrator).
+
+        Returns:
+            The Agreement entity if found and the user participates in it,
+            None otherwise.
+        """
+        result = await self._session.execute(
+            _FIND_BY_ID_FOR_PARTICIPANT,
+            {"agreement_id": agreement_id, "user_id": user_id},
+        )
         return result.scalar_one_or_none()
 
+    async def exists(self, agreement_id: str) -> bool:
+        """Check whether an agreement exists.
+
+        Args:
+            agreement_id: The agreement identifier.
+
+        Returns:
+            True if the agreement exists, False otherwise.
+        """
+        result = await self._session.execute(_EXISTS, {"agreement_id": agreement_id})
+        return result.scalar_one()
+
     async def list_by_user(
         self,
         user_id: uuid.UUID,
         status_filter: AgreementStatus | None = None,
         limit: int = 10,
         offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+        with_participants: bool = False,
     ) -> tuple[list[Agreement], int]:
         """List agreements where the user is a participant.
 
         A user is a participant if they are the payer, payee, or arbitrator.
+        Results are ordered newest first, with agreement_id as a tie-breaker.
 
         Args:
             user_id: The user's UUID.
             status_filter: Optional status to filter by.
             limit: Maximum number of agreements to return.
             offset: Number of agreements to skip.
+            after: Optional (created_at, agreement_id) keyset of the last row
+                already seen; only rows sorting after it are returned.
+            with_participants: Whether to eager-load the payer, payee and
+                arbitrator users of the returned agreements.
 
         Returns:
             A tuple containing:
@@ -92,51 +196,68 @@ class AgreementRepository:
             - Total count of agreements matching the filter.
         """
         # Base condition
-        where_clause = or_(
-            Agreement.payer_id == user_id,
-            Agreement.payee_id == user_id,
-            Agreement.arbitrator_id == user_id,
-        )
+        where_clause = _participant_clause(user_id)
 
         if status_filter is not None:
             where_clause = (where_clause) & (Agreement.status == status_filter)
 
-        # Count query
-        count_stmt = select(func.count()).where(where_clause)
-        total_result = await self._session.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        # Data query
+        # Data query; the total rides along as a window over the same scan
         stmt = (
-            select(Agreement)
+            select(Agreement, func.count().over().label("total"))
             .where(where_clause)
-            .order_by(Agreement.created_at.desc())
+            .order_by(Agreement.created_at.desc(), Agreement.agreement_id.desc())
             .limit(limit)
             .offset(offset)
         )
+        if after is not None:
+            # Keyset seek: the index range starts at the cursor, nothing is skipped
+            keyset_columns = (Agreement.created_at, Agreement.agreement_id)
+            stmt = stmt.where(
+                tuple_(*keyset_columns)
+                < tuple_(*after, types=[column.type for column in keyset_columns])
+            )
+        if with_participants:
+            stmt = stmt.options(*_participant_loaders())
 
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all()), total
+        rows = (await self._session.execute(stmt)).all()
+        items = [row.Agreement for row in rows]
+
+        if after is None and rows:
+            total = rows[0].total
+        elif after is None and offset == 0:
+            total = 0
+        else:
+            # The window only sees rows past the cursor, or none past the
+            # offset, so the overall total needs its own count
+            count_stmt = select(func.count()).where(where_clause)
+            total = (await self._session.execute(count_stmt)).scalar_one()
+
+        return items, total
 
     async def count_by_user_and_status(
         self,
         user_id: uuid.UUID,
         status: AgreementStatus,
+        cap: int | None = None,
     ) -> int:
         """Count agreements for a user with a specific status.
 
         Args:
             user_id: The user's UUID (checked against payer_id).
             status: The status to filter by.
+            cap: Optional upper bound; counting stops once it is reached, so
+                the result is min(actual count, cap).
 
         Returns:
             The count of agreements.
         """
-        stmt = select(func.count()).where(
-            Agreement.payer_id == user_id,
-            Agreement.status == status,
-        )
-        result = await self._session.execute(stmt)
+        params = {"user_id": user_id, "status": status}
+        if cap is None:
+            result = await self._session.execute(_COUNT_BY_PAYER_AND_STATUS, params)
+        else:
+            result = await self._session.execute(
+                _CAPPED_COUNT_BY_PAYER_AND_STATUS, {**params, "cap": cap}
+            )
         return result.scalar_one()
 
     async def update_status(
@@ -153,7 +274,48 @@ class AgreementRepository:
         Returns:
             The updated Agreement entity.
         """
-        agreement.status = new_status
-        await self._session.flush()
-        await self._session.refresh(agreement)
-        return agreement
+        # One round-trip: the returned row refreshes the identity-mapped instance
+        stmt = (
+            update(Agreement)
+            .where(Agreement.agreement_id == agreement.agreement_id)
+            .values(status=new_status)
+            .returning(Agreement)
+            .execution_options(synchronize_session="fetch", populate_existing=True)
+        )
+        result = await self._session.scalars(stmt)
+        return result.one()
+
+    async def transition(
+        self,
+        agreement_id: str,
+        expected_status: AgreementStatus,
+        new_status: AgreementStatus,
+        **values: Any,
+    ) -> Agreement | None:
+        """Atomically move an agreement from one status to another.
+
+        The status guard and the write happen in a single
+        ``UPDATE ... WHERE status = :expected RETURNING`` statement, so
+        concurrent transitions cannot both succeed.
+
+        Args:
+            agreement_id: The agreement identifier.
+            expected_status: The status the agreement must currently have.
+            new_status: The status to move to.
+            **values: Additional columns to set in the same statement.
+
+        Returns:
+            The updated Agreement entity, or None if no agreement with that ID
+            is in the expected status.
+        """
+        stmt = (
+            update(Agreement)
+            .where(
+                Agreement.agreement_id == agreement_id,
+                Agreement.status == expected_status,
+            )
+            .values(status=new_status, **values)
+            .returning(Agreement)
+        )
+        result = await self._session.scalars(stmt)
+        return result.one_or_none()
@@ -1,13 +1,19 @@
 """Agreement schemas module."""
 
 from src.modules.agreements.schemas.agreement_schemas import (
+    AgreementId,
     AgreementListResponse,
     AgreementResponse,
     CreateAgreementRequest,
+    decode_agreement_cursor,
+    encode_agreement_cursor,
 )
 
 __all__ = [
+    "AgreementId",
     "AgreementListResponse",
     "AgreementResponse",
     "CreateAgreementRequest",
+    "decode_agreement_cursor",
+    "encode_agreement_cursor",
 ]
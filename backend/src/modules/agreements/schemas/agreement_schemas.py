@@ -1,12 +1,73 @@
 """Agreement schemas for API request/response validation."""
 
+import base64
+import re
 import uuid
 from datetime import datetime
-from decimal import Decimal
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    StringConstraints,
+    field_validator,
+)
 
 from src.modules.agreements.core.enums import AgreementStatus, ArbitrationPolicy
+from src.modules.agreements.core.exceptions import InvalidAgreementCursorError
+from src.modules.agreements.core.models import Agreement
+
+# bytes32 agreement identifier as sent by clients: 0x + 64 hex chars
+AGREEMENT_ID_PATTERN = r"^0x[0-9a-fA-F]{64}$"
+AgreementId = Annotated[str, StringConstraints(pattern=AGREEMENT_ID_PATTERN)]
+
+_AGREEMENT_ID_RE = re.compile(AGREEMENT_ID_PATTERN)
+
+# uint256 wei amounts are validated as native ints but stay strings on the
+# wire, since JSON numbers lose precision past 2**53 in most clients
+MAX_UINT256 = 2**256 - 1
+WeiAmount = Annotated[
+    int, Field(le=MAX_UINT256), PlainSerializer(str, return_type=str, when_used="json")
+]
+
+
+def encode_agreement_cursor(created_at: datetime, agreement_id: str) -> str:
+    """Encode the sort key of the last listed agreement as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last agreement on the page.
+        agreement_id: Identifier of the last agreement on the page.
+
+    Returns:
+        A URL-safe cursor string.
+    """
+    raw = f"{created_at.isoformat()}|{agreement_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_agreement_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_agreement_cursor.
+
+    Args:
+        cursor: The cursor string received from the client.
+
+    Returns:
+        The (created_at, agreement_id) sort key to continue after.
+
+    Raises:
+        InvalidAgreementCursorError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, agreement_id = raw.split("|")
+        key = datetime.fromisoformat(created_at), agreement_id
+    except ValueError as e:
+        raise InvalidAgreementCursorError(cursor) from e
+    if key[0].tzinfo is None or not _AGREEMENT_ID_RE.match(agreement_id):
+        raise InvalidAgreementCursorError(cursor)
+    return key
 
 
 class CreateAgreementRequest(BaseModel):
@@ -22,14 +83,14 @@ class CreateAgreementRequest(BaseModel):
     arbitration_policy: ArbitrationPolicy = Field(
         description="Arbitration policy for the agreement"
     )
-    amount_wei: Decimal = Field(
+    amount_wei: WeiAmount = Field(
         description="Amount in wei (must be positive)",
         examples=["1000000000000000000"],  # 1 ETH
     )
 
     @field_validator("amount_wei")
     @classmethod
-    def validate_positive_amount(cls, v: Decimal) -> Decimal:
+    def validate_positive_amount(cls, v: int) -> int:
         """Validate that amount is positive."""
         if v <= 0:
             raise ValueError("Amount must be positive")
@@ -50,7 +111,7 @@ class AgreementResponse(BaseModel):
     arbitration_policy: ArbitrationPolicy = Field(
         description="Arbitration policy for the agreement"
     )
-    amount_wei: Decimal = Field(description="Amount in wei")
+    amount_wei: WeiAmount = Field(description="Amount in wei")
     status: AgreementStatus = Field(description="Current status of the agreement")
 
     # Transaction hashes
@@ -73,9 +134,36 @@ class AgreementResponse(BaseModel):
     created_at: datetime = Field(description="When the agreement was created")
     updated_at: datetime = Field(description="When the agreement was last updated")
 
+    @classmethod
+    def from_orm_row(cls, agreement: Agreement) -> "AgreementResponse":
+        """Build a response from a loaded Agreement without re-validating it.
+
+        Reads column values straight from the instance ``__dict__``, skipping
+        attribute instrumentation and pydantic validation. Columns loaded by a
+        SELECT are already typed by the database layer. If any field is not
+        loaded (e.g. expired after a commit), falls back to ``model_validate``,
+        which loads it through the ORM.
+
+        Args:
+            agreement: The loaded Agreement entity.
+
+        Returns:
+            The response model.
+        """
+        values = agreement.__dict__
+        if not values.keys() >= cls.model_fields.keys():
+            return cls.model_validate(agreement)
+        fields = {name: values[name] for name in cls.model_fields}
+        fields["amount_wei"] = int(fields["amount_wei"])
+        return cls.model_construct(**fields)
+
 
 class AgreementListResponse(BaseModel):
     """Response schema for a list of agreements."""
 
     items: list[AgreementResponse] = Field(description="List of agreements")
     total: int = Field(description="Total number of agreements")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page, or null when this page is the last",
+    )
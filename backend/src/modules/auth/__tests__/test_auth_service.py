@@ -4,12 +4,16 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from httpx import Request, Response
 
 from src.modules.auth.core.exceptions import SessionNotFoundError
 from src.modules.auth.core.models.session import Session
-from src.modules.auth.core.services.auth_service import AuthService
+from src.modules.auth.core.services.auth_service import (
+    AuthService,
+    _verify_oauth2_token,
+)
 from src.modules.auth.core.services.jwt_service import JwtService
 from src.modules.auth.persistence.session_repository import SessionRepository
 from src.modules.auth.schemas import Token
@@ -37,11 +41,19 @@ def mock_session_repository():
 
 
 @pytest.fixture
-def auth_service(mock_user_service, mock_jwt_service, mock_session_repository):
+def mock_http_client():
+    return AsyncMock(spec=httpx.AsyncClient)
+
+
+@pytest.fixture
+def auth_service(
+    mock_user_service, mock_jwt_service, mock_session_repository, mock_http_client
+):
     return AuthService(
         user_service=mock_user_service,
         jwt_service=mock_jwt_service,
         session_repository=mock_session_repository,
+        http_client=mock_http_client,
     )
 
 
@@ -59,10 +71,10 @@ def mock_settings():
 
 
 @pytest.fixture
-def mock_google_oauth():
+def mock_google_oauth(mock_http_client):
     """Mock Google OAuth flow including httpx client and token verification."""
     def _mock_google_oauth(google_id: str, email: str, id_token: str = "test-id-token"):
-        mock_client = AsyncMock()
+        mock_client = mock_http_client
 
         mock_client.post.return_value = Response(
             200,
@@ -97,10 +109,8 @@ async def test_login_with_google_success_existing_user(
     
     mock_client, mock_verify_data = mock_google_oauth("google-id-123", "test@example.com")
     
-    with patch("httpx.AsyncClient") as mock_client_cls, \
-         patch("src.modules.auth.core.services.auth_service.google_id_token.verify_oauth2_token") as mock_verify:
+    with patch("src.modules.auth.core.services.auth_service.google_id_token.verify_oauth2_token") as mock_verify:
         
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
         mock_verify.return_value = mock_verify_data
         
         token, refresh_token = await auth_service.login_with_google(code)
@@ -118,6 +128,7 @@ async def test_login_with_google_success_existing_user(
     assert call_args["user_id"] == mock_user_id
     assert "refresh_token_hash" in call_args
     assert "expires_at" in call_args
+    mock_client.post.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -129,12 +140,12 @@ async def test_get_session_success(
     session = Session(
         id=uuid.uuid4(),
         user_id=mock_user_id,
-        refresh_token_hash="hashed-token",
+        refresh_token_hash=b"hashed-token",
         expires_at=datetime.now(UTC) + timedelta(days=1),
         revoked_at=None
     )
     
-    mock_session_repository.get_by_hash.return_value = session
+    mock_session_repository.get_active_by_hash.return_value = session
     mock_jwt_service.create_access_token.return_value = Token(
         access_token="new-access-token",
         expires_in=3600
@@ -143,14 +154,14 @@ async def test_get_session_success(
     token = await auth_service.get_session(refresh_token)
     
     assert token.access_token == "new-access-token"
-    mock_session_repository.get_by_hash.assert_called_once()
+    mock_session_repository.get_active_by_hash.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_get_session_not_found(
     auth_service, mock_session_repository
 ):
-    mock_session_repository.get_by_hash.return_value = None
+    mock_session_repository.get_active_by_hash.return_value = None
     
     with pytest.raises(SessionNotFoundError):
         await auth_service.get_session("invalid-token")
@@ -165,12 +176,12 @@ async def test_refresh_session_success(
     session = Session(
         id=uuid.uuid4(),
         user_id=mock_user_id,
-        refresh_token_hash="hashed-token",
+        refresh_token_hash=b"hashed-token",
         expires_at=datetime.now(UTC) + timedelta(days=1),
         revoked_at=None
     )
     
-    mock_session_repository.get_by_hash.return_value = session
+    mock_session_repository.rotate.return_value = session
     mock_jwt_service.create_access_token.return_value = Token(
         access_token="rotated-access-token",
         expires_in=3600
@@ -180,7 +191,50 @@ async def test_refresh_session_success(
     
     assert token.access_token == "rotated-access-token"
     assert new_refresh_token != refresh_token
-    mock_session_repository.update_rotation.assert_called_once()
+    mock_session_repository.rotate.assert_called_once()
+    mock_jwt_service.create_access_token.assert_called_once_with(mock_user_id)
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_inactive(
+    auth_service, mock_session_repository
+):
+    mock_session_repository.rotate.return_value = None
+    mock_session_repository.get_active_by_hash.return_value = None
+
+    with pytest.raises(SessionNotFoundError):
+        await auth_service.refresh_session("revoked-refresh-token")
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_recently_used_keeps_token(
+    auth_service, mock_session_repository, mock_jwt_service
+):
+    refresh_token = "recent-refresh-token"
+    mock_user_id = uuid.uuid4()
+    session = Session(
+        id=uuid.uuid4(),
+        user_id=mock_user_id,
+        refresh_token_hash=b"hashed-token",
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+        revoked_at=None,
+        last_used_at=datetime.now(UTC),
+    )
+
+    mock_session_repository.rotate.return_value = None
+    mock_session_repository.get_active_by_hash.return_value = session
+    mock_jwt_service.create_access_token.return_value = Token(
+        access_token="fresh-access-token",
+        expires_in=3600
+    )
+
+    token, returned_refresh_token = await auth_service.refresh_session(
+        refresh_token
+    )
+
+    assert token.access_token == "fresh-access-token"
+    assert returned_refresh_token == refresh_token
+    mock_jwt_service.create_access_token.assert_called_once_with(mock_user_id)
 
 
 @pytest.mark.asyncio
@@ -188,9 +242,50 @@ async def test_logout_success(
     auth_service, mock_session_repository
 ):
     refresh_token = "valid-refresh-token"
-    session = Session(id=uuid.uuid4(), refresh_token_hash="hash")
-    mock_session_repository.get_by_hash.return_value = session
+    session = Session(id=uuid.uuid4(), refresh_token_hash=b"hash")
+    mock_session_repository.get_active_by_hash.return_value = session
     
     await auth_service.logout(refresh_token)
     
     mock_session_repository.revoke.assert_called_once_with(session.id)
+
+
+def test_verify_oauth2_token_refetches_certs_on_unknown_key_id():
+    claims = {"sub": "google-id-123"}
+    with (
+        patch(
+            "src.modules.auth.core.services.auth_service.google_id_token"
+            ".verify_oauth2_token"
+        ) as mock_verify,
+        patch(
+            "src.modules.auth.core.services.auth_service._certs_request"
+        ) as mock_certs,
+    ):
+        mock_verify.side_effect = [
+            ValueError("Certificate for key id abc not found."),
+            claims,
+        ]
+
+        assert _verify_oauth2_token("test-id-token") == claims
+
+    mock_certs.invalidate.assert_called_once()
+    assert mock_verify.call_count == 2
+
+
+def test_verify_oauth2_token_other_errors_are_not_retried():
+    with (
+        patch(
+            "src.modules.auth.core.services.auth_service.google_id_token"
+            ".verify_oauth2_token"
+        ) as mock_verify,
+        patch(
+            "src.modules.auth.core.services.auth_service._certs_request"
+        ) as mock_certs,
+    ):
+        mock_verify.side_effect = ValueError("Token expired")
+
+        with pytest.raises(ValueError):
+            _verify_oauth2_token("test-id-token")
+
+    mock_certs.invalidate.assert_not_called()
+    assert mock_verify.call_count == 1
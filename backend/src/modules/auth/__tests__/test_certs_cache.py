@@ -0,0 +1,74 @@
+"""Tests for CachedCertsRequest."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.modules.auth.core.utils.certs_cache import CachedCertsRequest
+
+CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+
+
+@pytest.fixture
+def inner_request():
+    with patch(
+        "src.modules.auth.core.utils.certs_cache.requests.Request"
+    ) as mock_request_cls:
+        inner = mock_request_cls.return_value
+        inner.return_value = MagicMock(status=200)
+        yield inner
+
+
+def test_get_is_served_from_cache(inner_request):
+    certs_request = CachedCertsRequest()
+
+    first = certs_request(CERTS_URL)
+    second = certs_request(CERTS_URL)
+
+    assert first is second
+    inner_request.assert_called_once()
+
+
+def test_expired_entry_is_refetched(inner_request):
+    certs_request = CachedCertsRequest(ttl_seconds=0)
+
+    certs_request(CERTS_URL)
+    certs_request(CERTS_URL)
+
+    assert inner_request.call_count == 2
+
+
+def test_failed_response_is_not_cached(inner_request):
+    inner_request.return_value = MagicMock(status=500)
+    certs_request = CachedCertsRequest()
+
+    certs_request(CERTS_URL)
+    certs_request(CERTS_URL)
+
+    assert inner_request.call_count == 2
+
+
+def test_invalidate_forces_refetch(inner_request):
+    certs_request = CachedCertsRequest()
+
+    certs_request(CERTS_URL)
+    certs_request.invalidate()
+    certs_request(CERTS_URL)
+
+    assert inner_request.call_count == 2
+
+
+def test_default_timeout_is_left_to_inner_transport(inner_request):
+    certs_request = CachedCertsRequest()
+
+    certs_request(CERTS_URL, method="GET")
+
+    assert "timeout" not in inner_request.call_args.kwargs
+
+
+def test_explicit_timeout_is_forwarded(inner_request):
+    certs_request = CachedCertsRequest()
+
+    certs_request(CERTS_URL, timeout=5)
+
+    assert inner_request.call_args.kwargs["timeout"] == 5
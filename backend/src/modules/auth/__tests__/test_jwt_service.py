@@ -1,13 +1,24 @@
 """Tests for JwtService."""
 
+import uuid
 from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
+import jwt
 import pytest
-from jose import jwt
 
 from src.modules.auth.core.exceptions import ExpiredTokenError, InvalidTokenError
-from src.modules.auth.core.services.jwt_service import JwtService
+from src.modules.auth.core.services.jwt_service import (
+    JwtService,
+    clear_decoded_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_decoded_cache()
+    yield
+    clear_decoded_cache()
 
 
 @pytest.fixture
@@ -38,6 +49,19 @@ def test_create_access_token(jwt_service, mock_settings):
     assert decoded["sub"] == subject
 
 
+def test_create_access_token_uuid_subject_is_hex(jwt_service, mock_settings):
+    subject = uuid.uuid4()
+    token = jwt_service.create_access_token(subject)
+
+    decoded = jwt.decode(
+        token.access_token,
+        mock_settings.jwt_secret_key,
+        algorithms=[mock_settings.jwt_algorithm],
+    )
+    assert decoded["sub"] == subject.hex
+    assert uuid.UUID(hex=decoded["sub"]) == subject
+
+
 def test_decode_token_success(jwt_service, mock_settings):
     subject = "user-123"
     token_str = jwt.encode(
@@ -66,3 +90,52 @@ def test_decode_token_expired(jwt_service, mock_settings):
 def test_decode_token_invalid(jwt_service, mock_settings):
     with pytest.raises(InvalidTokenError):
         jwt_service.decode_token("invalid-token")
+
+
+def test_decode_token_cached(jwt_service, mock_settings):
+    token_str = jwt.encode(
+        {"sub": "user-123", "exp": datetime.now(UTC) + timedelta(minutes=5)},
+        mock_settings.jwt_secret_key,
+        algorithm=mock_settings.jwt_algorithm,
+    )
+
+    with patch(
+        "src.modules.auth.core.services.jwt_service.jwt.decode", wraps=jwt.decode
+    ) as mock_decode:
+        first = jwt_service.decode_token(token_str)
+        second = jwt_service.decode_token(token_str)
+
+    assert first == second
+    mock_decode.assert_called_once()
+
+
+def test_decode_token_cached_payload_is_not_shared(jwt_service, mock_settings):
+    token_str = jwt.encode(
+        {"sub": "user-123", "exp": datetime.now(UTC) + timedelta(minutes=5)},
+        mock_settings.jwt_secret_key,
+        algorithm=mock_settings.jwt_algorithm,
+    )
+
+    first = jwt_service.decode_token(token_str)
+    first["sub"] = "tampered"
+    second = jwt_service.decode_token(token_str)
+    second["sub"] = "tampered"
+
+    assert jwt_service.decode_token(token_str)["sub"] == "user-123"
+
+
+def test_decode_token_cached_then_expired(jwt_service, mock_settings):
+    expire = datetime.now(UTC) + timedelta(minutes=5)
+    token_str = jwt.encode(
+        {"sub": "user-123", "exp": expire},
+        mock_settings.jwt_secret_key,
+        algorithm=mock_settings.jwt_algorithm,
+    )
+    jwt_service.decode_token(token_str)
+
+    with patch(
+        "src.modules.auth.core.services.jwt_service.time.time",
+        return_value=expire.timestamp() + 1,
+    ):
+        with pytest.raises(ExpiredTokenError):
+            jwt_service.decode_token(token_str)
@@ -0,0 +1,32 @@
+"""Tests for token utilities."""
+
+import hashlib
+import hmac
+
+from src.config import settings
+from src.modules.auth.core.utils.token_utils import (
+    generate_refresh_token_with_hash,
+    hash_token,
+)
+
+
+def test_generate_refresh_token_with_hash_matches_hash_token():
+    token, token_hash = generate_refresh_token_with_hash()
+
+    assert token_hash == hash_token(token)
+
+
+def test_generate_refresh_token_with_hash_is_random():
+    first, _ = generate_refresh_token_with_hash()
+    second, _ = generate_refresh_token_with_hash()
+
+    assert first != second
+
+
+def test_hash_token_is_keyed_with_pepper():
+    expected = hmac.new(
+        settings.refresh_token_pepper.encode(), b"token", hashlib.sha256
+    ).digest()
+
+    assert hash_token("token") == expected
+    assert hash_token("token") != hashlib.sha256(b"token").digest()
@@ -4,6 +4,8 @@
 class InvalidTokenError(Exception):
     """Raised when JWT token is invalid."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Invalid token") -> None:
         self.message = message
         super().__init__(message)
@@ -12,6 +14,8 @@ class InvalidTokenError(Exception):
 class ExpiredTokenError(Exception):
     """Raised when JWT token is expired."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Token expired") -> None:
         self.message = message
         super().__init__(message)
@@ -20,6 +24,8 @@ class ExpiredTokenError(Exception):
 class InvalidGoogleCodeError(Exception):
     """Raised when Google code exchange fails (Invalid Code)."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
         super().__init__(message)
@@ -28,6 +34,8 @@ class InvalidGoogleCodeError(Exception):
 class SessionAlreadyExistsError(Exception):
     """Raised when trying to create a session that already exists."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Session already exists") -> None:
         self.message = message
         super().__init__(message)
@@ -36,6 +44,8 @@ class SessionAlreadyExistsError(Exception):
 class SessionNotFoundError(Exception):
     """Raised when session is not found."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Session not found") -> None:
         self.message = message
         super().__init__(message)
@@ -3,7 +3,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.shared.database.base import Base
@@ -12,11 +21,14 @@ from src.shared.database.base import Base
 class Session(Base):
     __tablename__ = "sessions"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, server_default=text("gen_random_uuid()")
+    )
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    refresh_token_hash: Mapped[str] = mapped_column(String, nullable=False)
+    # Raw SHA-256 digest: half the size of its hex form in the unique index
+    refresh_token_hash: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -36,5 +48,17 @@ class Session(Base):
 
     __table_args__ = (
         UniqueConstraint("refresh_token_hash", name="uq_sessions_refresh_token_hash"),
+        CheckConstraint(
+            "octet_length(refresh_token_hash) = 32",
+            name="ck_sessions_refresh_token_hash_length",
+        ),
         Index("idx_sessions_user_id", "user_id"),
+        # Active sessions in session-limit order; revoked rows never enter it
+        Index(
+            "idx_sessions_active",
+            "user_id",
+            text("last_used_at DESC NULLS LAST"),
+            text("created_at DESC"),
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
     )
\ No newline at end of file
@@ -1,14 +1,32 @@
 """JWT service."""
 
+import hashlib
+import time
+import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from jose import JWTError, jwt
+import jwt
 
 from src.config import settings
 from src.modules.auth.core.exceptions import ExpiredTokenError, InvalidTokenError
 from src.modules.auth.schemas import Token
 
+# Verified payloads keyed by a digest of the token (raw tokens are not kept).
+# Entries live for at most the TTL and never past the token's own expiry.
+_DECODED_CACHE_MAX_SIZE = 10_000
+_DECODED_CACHE_TTL_SECONDS = 60
+_decoded_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+
+def _cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def clear_decoded_cache() -> None:
+    """Drop every cached token payload."""
+    _decoded_cache.clear()
+
 
 class JwtService:
     """Service for handling JWT tokens."""
@@ -18,7 +36,9 @@ class JwtService:
         expire = datetime.now(UTC) + timedelta(
             minutes=settings.access_token_expire_minutes
         )
-        to_encode = {"sub": str(subject), "exp": expire}
+        # UUID subjects go out as 32-char hex, the cheapest form to parse back
+        sub = subject.hex if isinstance(subject, uuid.UUID) else str(subject)
+        to_encode = {"sub": sub, "exp": expire}
         encoded_jwt = jwt.encode(
             to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
         )
@@ -40,14 +60,34 @@ class JwtService:
             ExpiredTokenError: If token is expired.
             InvalidTokenError: If token is invalid.
         """
+        key = _cache_key(token)
+        now = time.time()
+        cached = _decoded_cache.get(key)
+        if cached is not None:
+            valid_until, payload = cached
+            if now < valid_until:
+                # A copy, so callers cannot alter what later requests see
+                return dict(payload)
+            del _decoded_cache[key]
+            if "exp" in payload and payload["exp"] <= now:
+                raise ExpiredTokenError()
+
         try:
             payload = jwt.decode(
                 token,
                 settings.jwt_secret_key,
                 algorithms=[settings.jwt_algorithm],
             )
-            return payload
         except jwt.ExpiredSignatureError as e:
             raise ExpiredTokenError() from e
-        except JWTError as e:
+        except jwt.PyJWTError as e:
             raise InvalidTokenError() from e
+
+        if len(_decoded_cache) >= _DECODED_CACHE_MAX_SIZE:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            del _decoded_cache[next(iter(_decoded_cache))]
+        valid_until = now + _DECODED_CACHE_TTL_SECONDS
+        if "exp" in payload:
+            valid_until = min(valid_until, payload["exp"])
+        _decoded_cache[key] = (valid_until, payload)
+        return dict(payload)
@@ -0,0 +1,59 @@
+"""Caching HTTP transport for Google's ID token signing certificates."""
+
+import time
+from typing import Any
+
+from google.auth import transport
+from google.auth.transport import requests
+
+GOOGLE_CERTS_TTL_SECONDS = 3600
+
+
+class CachedCertsRequest(transport.Request):
+    """google-auth transport that memoizes GET responses for a TTL.
+
+    ``verify_oauth2_token`` fetches Google's certificates on every call. Routing
+    it through this transport makes verification pure crypto after warm-up.
+    """
+
+    def __init__(self, ttl_seconds: int = GOOGLE_CERTS_TTL_SECONDS) -> None:
+        """Initialize the transport.
+
+        Args:
+            ttl_seconds: How long a fetched response stays fresh.
+        """
+        self._inner = requests.Request()
+        self._ttl_seconds = ttl_seconds
+        self._cache: dict[str, tuple[float, transport.Response]] = {}
+
+    def __call__(
+        self,
+        url: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: Any = None,
+        timeout: Any = None,
+        **kwargs: Any,
+    ) -> transport.Response:
+        """Serve fresh cached GET responses, fetching on a miss."""
+        # Leave the inner transport's default timeout in place unless one is
+        # given; the fetch blocks the event loop while it runs
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        if method != "GET":
+            return self._inner(url, method, body, headers, **kwargs)
+
+        cached = self._cache.get(url)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        response = self._inner(url, method, body, headers, **kwargs)
+        if response.status == 200:
+            self._cache[url] = (now + self._ttl_seconds, response)
+        return response
+
+    def invalidate(self) -> None:
+        """Drop all cached responses, forcing the next call to refetch."""
+        self._cache.clear()
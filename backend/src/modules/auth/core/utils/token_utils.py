@@ -1,25 +1,41 @@
 """Token utility functions."""
 
 import hashlib
+import hmac
 import secrets
 
+from src.config import settings
 
-def generate_refresh_token() -> str:
-    """Generate a secure random refresh token.
+# Keyed once; each hash copies this state instead of redoing the key schedule
+_TOKEN_MAC = hmac.new(settings.refresh_token_pepper.encode(), digestmod=hashlib.sha256)
 
-    Returns:
-        A URL-safe random string.
-    """
-    return secrets.token_urlsafe(32)
+
+def _mac(token_bytes: bytes) -> bytes:
+    mac = _TOKEN_MAC.copy()
+    mac.update(token_bytes)
+    return mac.digest()
 
 
-def hash_token(token: str) -> str:
-    """Hash a token using SHA-256.
+def hash_token(token: str) -> bytes:
+    """Hash a token using HMAC-SHA256 keyed with the server-side pepper.
 
     Args:
         token: The token string to hash.
 
     Returns:
-        The hexadecimal representation of the hash.
+        The 32-byte digest.
+    """
+    return _mac(token.encode())
+
+
+def generate_refresh_token_with_hash() -> tuple[str, bytes]:
+    """Generate a refresh token together with its stored hash.
+
+    The hash is taken over the token string exactly as the client will send
+    it back, so it always matches ``hash_token`` on later lookups.
+
+    Returns:
+        A tuple of the URL-safe token and its 32-byte HMAC-SHA256 digest.
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    token = secrets.token_urlsafe(32)
+    return token, _mac(token.encode("ascii"))
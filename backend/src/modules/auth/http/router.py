@@ -14,10 +14,14 @@ from src.modules.auth.schemas import Token
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def get_valid_refresh_token(
+async def get_valid_refresh_token(
     refresh_token: Annotated[str | None, Cookie(alias=settings.refresh_cookie_name)] = None
 ) -> str:
-    """Dependency to retrieve and validate refresh token from cookie."""
+    """Dependency to retrieve and validate refresh token from cookie.
+
+    Routes list it before the auth service so a missing cookie is rejected
+    before any other dependency is built.
+    """
     if not refresh_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -77,8 +81,8 @@ async def login_with_google(
     description="Get a new access token using the refresh token cookie. (Swagger doesn't support cookies)",
 )
 async def get_session(
-    service: Annotated[AuthService, Depends(get_auth_service)],
     refresh_token: Annotated[str, Depends(get_valid_refresh_token)],
+    service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> Token:
     """Get access token from session."""
     return await service.get_session(refresh_token)
@@ -92,8 +96,8 @@ async def get_session(
 )
 async def refresh_session(
     response: Response,
-    service: Annotated[AuthService, Depends(get_auth_service)],
     refresh_token: Annotated[str, Depends(get_valid_refresh_token)],
+    service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> Token:
     """Refresh session and rotate token."""
     access_token, new_refresh_token = await service.refresh_session(refresh_token)
@@ -119,8 +123,8 @@ async def refresh_session(
 )
 async def logout(
     response: Response,
-    service: Annotated[AuthService, Depends(get_auth_service)],
     refresh_token: Annotated[str, Depends(get_valid_refresh_token)],
+    service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> None:
     """Logout."""
     if refresh_token:
@@ -137,8 +141,8 @@ async def logout(
 )
 async def logout_all(
     response: Response,
-    service: Annotated[AuthService, Depends(get_auth_service)],
     user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
+    service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> None:
     """Logout all sessions."""
     await service.logout_all(user_id)
@@ -4,11 +4,12 @@ import uuid
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+import httpx
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.modules.auth.core.exceptions import ExpiredTokenError, InvalidTokenError
+from src.modules.auth.core.exceptions import InvalidTokenError
 from src.modules.auth.core.services.auth_service import AuthService
 from src.modules.auth.core.services.jwt_service import JwtService
 from src.modules.auth.persistence.session_repository import SessionRepository
@@ -16,9 +17,13 @@ from src.modules.users.core.services import UserService
 from src.modules.users.module import get_user_service
 from src.shared.database.session import get_session
 
+# Stateless, so one instance serves every request.
+_jwt_service = JwtService()
 
-async def get_jwt_service() -> AsyncGenerator[JwtService, None]:
-    yield JwtService()
+
+async def get_jwt_service() -> JwtService:
+    """Get the shared JwtService."""
+    return _jwt_service
 
 
 async def get_session_repository(
@@ -27,12 +32,18 @@ async def get_session_repository(
     yield SessionRepository(session)
 
 
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Get the application's shared HTTP client, created in the lifespan."""
+    return request.app.state.http_client
+
+
 async def get_auth_service(
     user_service: Annotated[UserService, Depends(get_user_service)],
     jwt_service: Annotated[JwtService, Depends(get_jwt_service)],
     session_repository: Annotated[SessionRepository, Depends(get_session_repository)],
+    http_client: Annotated[httpx.AsyncClient, Depends(get_http_client)],
 ) -> AsyncGenerator[AuthService, None]:
-    yield AuthService(user_service, jwt_service, session_repository)
+    yield AuthService(user_service, jwt_service, session_repository, http_client)
 
 
 security = HTTPBearer()
@@ -56,7 +67,9 @@ async def get_current_user_id(
         InvalidTokenError: If the token is invalid.
     """
     payload = jwt_service.decode_token(token.credentials)
-    user_id_str = payload.get("sub")
-    return uuid.UUID(str(user_id_str))
+    try:
+        return uuid.UUID(hex=payload["sub"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidTokenError() from e
 
 
@@ -1,15 +1,75 @@
 """Session repository for database access."""
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import Row, bindparam, delete, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.auth.core.exceptions import SessionAlreadyExistsError
 from src.modules.auth.core.models.session import Session
 
+# Hot-path statements are built once; callers only supply bind values
+_GET_ACTIVE_BY_HASH = select(Session.id, Session.user_id).where(
+    Session.refresh_token_hash == bindparam("refresh_token_hash"),
+    Session.revoked_at.is_(None),
+    Session.expires_at > bindparam("now"),
+)
+_ROTATE = (
+    update(Session)
+    .where(
+        Session.refresh_token_hash == bindparam("old_hash"),
+        Session.revoked_at.is_(None),
+        Session.expires_at > bindparam("now"),
+        or_(
+            Session.last_used_at.is_(None),
+            Session.last_used_at <= bindparam("last_used_before"),
+        ),
+    )
+    .values(refresh_token_hash=bindparam("new_hash"), last_used_at=bindparam("now"))
+    .returning(Session)
+)
+_REVOKE = (
+    update(Session)
+    .where(Session.id == bindparam("session_id"))
+    .values(revoked_at=bindparam("now"))
+)
+_REVOKE_ALL_FOR_USER = (
+    update(Session)
+    .where(Session.user_id == bindparam("user_id"), Session.revoked_at.is_(None))
+    .values(revoked_at=bindparam("now"))
+)
+# Everything past the :keep most recently used active sessions
+_REVOKE_EXCESS = (
+    update(Session)
+    .where(
+        Session.id.in_(
+            select(Session.id)
+            .where(
+                Session.user_id == bindparam("user_id"),
+                Session.revoked_at.is_(None),
+                Session.expires_at > bindparam("now"),
+            )
+            .order_by(
+                Session.last_used_at.desc().nullslast(),
+                Session.created_at.desc(),
+            )
+            .offset(bindparam("keep"))
+            .scalar_subquery()
+        )
+    )
+    .values(revoked_at=bindparam("now"))
+)
+_DELETE_EXPIRED = delete(Session).where(
+    Session.id.in_(
+        select(Session.id)
+        .where(Session.expires_at < bindparam("now"))
+        .limit(bindparam("limit"))
+        .scalar_subquery()
+    )
+)
+
 
 class SessionRepository:
     """Repository for Session model."""
@@ -20,7 +80,7 @@ class SessionRepository:
     async def create(
         self,
         user_id: uuid.UUID,
-        refresh_token_hash: str,
+        refresh_token_hash: bytes,
         expires_at: datetime,
     ) -> Session:
         """Create a new session."""
@@ -37,87 +97,92 @@ class SessionRepository:
             raise SessionAlreadyExistsError() from e
         return session
 
-    async def get_by_hash(self, refresh_token_hash: str) -> Session | None:
-        """Get session by refresh token hash."""
-        stmt = select(Session).where(Session.refresh_token_hash == refresh_token_hash)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
-
-    async def update_rotation(
-        self, session_id: uuid.UUID, new_hash: str, last_used_at: datetime
-    ) -> None:
-        """Update session with new refresh token hash and last used time."""
-        stmt = (
-            update(Session)
-            .where(Session.id == session_id)
-            .values(refresh_token_hash=new_hash, last_used_at=last_used_at)
+    async def get_active_by_hash(
+        self, refresh_token_hash: bytes
+    ) -> Row[tuple[uuid.UUID, uuid.UUID]] | None:
+        """Get the id and user_id of the active session with a token hash.
+
+        Revocation and expiry are checked in the query, so only the two
+        columns callers need are fetched.
+
+        Args:
+            refresh_token_hash: Hash of the refresh token being presented.
+
+        Returns:
+            A row with ``id`` and ``user_id``, or None if no session with
+            this hash is unrevoked and unexpired.
+        """
+        result = await self._session.execute(
+            _GET_ACTIVE_BY_HASH,
+            {"refresh_token_hash": refresh_token_hash, "now": datetime.now(UTC)},
         )
-        await self._session.execute(stmt)
+        return result.one_or_none()
+
+    async def rotate(
+        self,
+        old_hash: bytes,
+        new_hash: bytes,
+        now: datetime,
+        last_used_before: datetime,
+    ) -> Session | None:
+        """Swap the refresh token hash of an active session in one statement.
+
+        The active check and the swap happen in a single
+        ``UPDATE ... RETURNING``, so a refresh token can be rotated only once.
+
+        Args:
+            old_hash: Hash of the refresh token being presented.
+            new_hash: Hash of the replacement refresh token.
+            now: Current time, recorded as last use and compared to expiry.
+            last_used_before: Sessions used after this instant are left as is.
+
+        Returns:
+            The rotated session, or None if no active session with old_hash
+            was last used before last_used_before.
+        """
+        result = await self._session.scalars(
+            _ROTATE,
+            {
+                "old_hash": old_hash,
+                "new_hash": new_hash,
+                "now": now,
+                "last_used_before": last_used_before,
+            },
+        )
+        return result.one_or_none()
 
     async def revoke(self, session_id: uuid.UUID) -> None:
         """Revoke a session by setting revoked_at to current time."""
-        stmt = (
-            update(Session)
-            .where(Session.id == session_id)
-            .values(revoked_at=datetime.utcnow())
+        await self._session.execute(
+            _REVOKE, {"session_id": session_id, "now": datetime.now(UTC)}
         )
-        await self._session.execute(stmt)
 
     async def revoke_all_for_user(self, user_id: uuid.UUID) -> None:
         """Revoke all active sessions for a user."""
-        stmt = (
-            update(Session)
-            .where(Session.user_id == user_id, Session.revoked_at.is_(None))
-            .values(revoked_at=datetime.utcnow())
+        await self._session.execute(
+            _REVOKE_ALL_FOR_USER, {"user_id": user_id, "now": datetime.now(UTC)}
         )
-        await self._session.execute(stmt)
 
     async def enforce_session_limit(self, user_id: uuid.UUID, limit: int) -> None:
         """
         Enforce the maximum number of active sessions for a user.
-        Removes the oldest sessions if the count exceeds the limit.
+        Revokes the oldest sessions so that a new one fits within the limit.
         """
-        # Count active sessions (not revoked, not expired)
-        stmt_count = (
-            select(func.count(Session.id))
-            .where(
-                Session.user_id == user_id,
-                Session.revoked_at.is_(None),
-                Session.expires_at > datetime.utcnow()
-            )
+        await self._session.execute(
+            _REVOKE_EXCESS,
+            {"user_id": user_id, "now": datetime.now(UTC), "keep": max(limit - 1, 0)},
+        )
+
+    async def delete_expired(self, limit: int) -> int:
+        """Delete up to ``limit`` expired sessions.
+
+        Args:
+            limit: Maximum number of rows to delete in this statement.
+
+        Returns:
+            The number of sessions deleted.
+        """
+        result = await self._session.execute(
+            _DELETE_EXPIRED, {"now": datetime.now(UTC), "limit": limit}
         )
-        count = await self._session.scalar(stmt_count) or 0
-
-        if count >= limit:
-            excess = count - limit + 1
-            
-            if excess > 0:
-                stmt_oldest = (
-                    select(Session.id)
-                    .where(
-                        Session.user_id == user_id,
-                        Session.revoked_at.is_(None),
-                        Session.expires_at > datetime.utcnow()
-                    )
-                    .order_by(
-                        Session.last_used_at.asc().nullsfirst(), 
-                        Session.created_at.asc()
-                    )
-                    .limit(excess)
-                )
-                result = await self._session.execute(stmt_oldest)
-                ids_to_revoke = result.scalars().all()
-
-                if ids_to_revoke:
-                    stmt_revoke = (
-                        update(Session)
-                        .where(Session.id.in_(ids_to_revoke))
-                        .values(revoked_at=datetime.utcnow())
-                    )
-                    await self._session.execute(stmt_revoke)
-
-    async def delete_expired(self) -> int:
-        """Delete expired sessions."""
-        stmt = delete(Session).where(Session.expires_at < datetime.utcnow())
-        result = await self._session.execute(stmt)
         return result.rowcount
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.config import settings
 from src.modules.auth.persistence.session_repository import SessionRepository
 from src.shared.database.session import async_session_factory
@@ -13,44 +15,59 @@ logger = logging.getLogger(__name__)
 class SessionCleanupWorker:
     """Worker to periodically clean up expired sessions."""
 
-    def __init__(self) -> None:
-        self._running = False
-        self._task: asyncio.Task | None = None
-
-    async def start(self) -> None:
-        """Start the worker in a background task."""
-        if self._running:
-            return
+    async def run(self) -> None:
+        """Run the cleanup loop until the surrounding task is cancelled.
 
-        self._running = True
-        self._task = asyncio.create_task(self._run_loop())
+        Cancellation interrupts the interval sleep immediately. During a
+        sweep, the batch in flight is shielded and allowed to commit, and no
+        further batch is started.
+        """
         logger.info("Session cleanup worker started.")
+        try:
+            while True:
+                await self._cleanup_expired()
+
+                # Sleep for the configured interval
+                await asyncio.sleep(settings.session_cleanup_interval_seconds)
+        finally:
+            logger.info("Session cleanup worker stopped.")
+
+    async def _cleanup_expired(self) -> None:
+        """Delete expired sessions in short batched transactions.
+
+        Each batch commits on its own, so a large backlog never holds row
+        locks or a snapshot for the whole sweep.
+        """
+        batch_size = settings.session_cleanup_batch_size
+        deleted_count = 0
+        try:
+            async with async_session_factory() as session:
+                repository = SessionRepository(session)
+                while True:
+                    batch = asyncio.ensure_future(
+                        self._delete_batch(session, repository, batch_size)
+                    )
+                    try:
+                        batch_count = await asyncio.shield(batch)
+                    except asyncio.CancelledError:
+                        deleted_count += await batch
+                        raise
+
+                    deleted_count += batch_count
+                    if batch_count < batch_size:
+                        break
+
+        except Exception as e:
+            logger.error(f"Error in session cleanup loop: {e}", exc_info=True)
+
+        finally:
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} expired sessions")
 
-    async def stop(self) -> None:
-        """Stop the worker."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Session cleanup worker stopped.")
-
-    async def _run_loop(self) -> None:
-        """Main cleanup loop."""
-        while self._running:
-            try:
-                async with async_session_factory() as session:
-                    repository = SessionRepository(session)
-                    deleted_count = await repository.delete_expired()
-                    await session.commit()
-                    
-                    if deleted_count > 0:
-                        logger.info(f"Cleaned up {deleted_count} expired sessions")
-
-            except Exception as e:
-                logger.error(f"Error in session cleanup loop: {e}", exc_info=True)
-
-            # Sleep for the configured interval
-            await asyncio.sleep(settings.session_cleanup_interval_seconds)
+    async def _delete_batch(
+        self, session: AsyncSession, repository: SessionRepository, batch_size: int
+    ) -> int:
+        """Delete and commit one batch of expired sessions."""
+        deleted_count = await repository.delete_expired(batch_size)
+        await session.commit()
+        return deleted_count
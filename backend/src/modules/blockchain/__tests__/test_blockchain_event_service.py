@@ -1,6 +1,6 @@
 """Tests for BlockchainEventService."""
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 
@@ -58,21 +58,22 @@ async def test_process_agreement_created(service, mock_event_repo, mock_agreemen
     # Mock create_if_not_exists to return True (new event)
     mock_event_repo.create_if_not_exists.return_value = True
     
-    # Mock agreement finding
-    agreement = Mock()
-    agreement.status = AgreementStatus.DRAFT
-    mock_agreement_repo.find_by_id.return_value = agreement
+    # Mock the guarded DRAFT -> CREATED transition
+    mock_agreement_repo.transition.return_value = Mock()
 
     # Act
     await service.process_event(event_data)
 
     # Assert
     mock_event_repo.create_if_not_exists.assert_called_once()
-    mock_agreement_repo.find_by_id.assert_awaited_with(agreement_id_hex)
-    mock_agreement_repo.update_status.assert_awaited_with(
-        agreement, AgreementStatus.CREATED
+    mock_agreement_repo.transition.assert_awaited_once_with(
+        agreement_id_hex,
+        AgreementStatus.DRAFT,
+        AgreementStatus.CREATED,
+        created_tx_hash=b"txhash",
+        created_onchain_at=ANY,
     )
-    assert agreement.created_tx_hash == b"txhash"
+    mock_agreement_repo.exists.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -98,7 +99,7 @@ async def test_process_duplicate_event(service, mock_event_repo, mock_agreement_
 
     # Assert
     mock_event_repo.create_if_not_exists.assert_called_once()
-    mock_agreement_repo.find_by_id.assert_not_called()
+    mock_agreement_repo.transition.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -118,14 +119,15 @@ async def test_process_payment_funded(service, mock_event_repo, mock_agreement_r
     
     mock_event_repo.create_if_not_exists.return_value = True
     
-    agreement = Mock()
-    agreement.status = AgreementStatus.CREATED
-    mock_agreement_repo.find_by_id.return_value = agreement
-
     # Act
     await service.process_event(event_data)
 
     # Assert
-    mock_agreement_repo.update_status.assert_awaited_with(
-        agreement, AgreementStatus.FUNDED
+    mock_agreement_repo.transition.assert_awaited_once_with(
+        agreement_id_hex,
+        AgreementStatus.CREATED,
+        AgreementStatus.FUNDED,
+        funded_tx_hash=b"txhash",
+        funded_at=ANY,
     )
+    mock_agreement_repo.update_status.assert_not_called()
@@ -4,22 +4,23 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import (
-    JSON,
     BigInteger,
+    CheckConstraint,
     DateTime,
+    Enum,
     ForeignKey,
     Index,
     Integer,
-    String,
     Text,
     UniqueConstraint,
     func,
 )
-from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.modules.blockchain.core.enums.onchain_event_name import OnchainEventName
 from src.shared.database.base import Base
+from src.shared.database.types import HexBinary
 
 
 class OnchainEvent(Base):
@@ -38,19 +39,19 @@ class OnchainEvent(Base):
     log_index: Mapped[int] = mapped_column(Integer, nullable=False)
 
     event_name: Mapped[OnchainEventName] = mapped_column(
-        ENUM(OnchainEventName, name="onchain_event_name_enum", create_type=False),
+        Enum(OnchainEventName, native_enum=False, length=32),
         nullable=False,
     )
 
     agreement_id: Mapped[str] = mapped_column(
-        String(66), ForeignKey("agreements.agreement_id"), nullable=False
+        HexBinary, ForeignKey("agreements.agreement_id"), nullable=False
     )
 
     block_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
     block_hash: Mapped[str] = mapped_column(Text, nullable=False)
 
-    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
 
     processed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -62,6 +63,14 @@ class OnchainEvent(Base):
     agreement = relationship("Agreement", foreign_keys=[agreement_id], lazy="joined")
 
     __table_args__ = (
+        CheckConstraint(
+            "event_name IN ('AGREEMENT_CREATED', 'PAYMENT_FUNDED', "
+            "'DISPUTE_OPENED', 'PAYMENT_RELEASED', 'PAYMENT_REFUNDED')",
+            name="ck_onchain_events_event_name",
+        ),
+        # Kept as a full-table constraint: ON CONFLICT in create_if_not_exists
+        # targets it by name, and a re-sync from an old block must still be
+        # deduplicated against events processed long ago.
         UniqueConstraint(
             "chain_id", "tx_hash", "log_index", name="uq_onchain_events_idempotent"
         ),
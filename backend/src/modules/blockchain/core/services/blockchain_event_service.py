@@ -93,27 +93,28 @@ class BlockchainEventService:
 
     async def _handle_agreement_created(self, event: OnchainEvent) -> None:
         """Handle AgreementCreated event."""
-        agreement = await self._agreement_repo.find_by_id(event.agreement_id)
-        if not agreement:
+        agreement = await self._agreement_repo.transition(
+            event.agreement_id,
+            AgreementStatus.DRAFT,
+            AgreementStatus.CREATED,
+            created_tx_hash=event.tx_hash,
+            created_onchain_at=event.processed_at,  # Approximate
+        )
+        if agreement is None and not await self._agreement_repo.exists(
+            event.agreement_id
+        ):
             logger.error(f"Agreement {event.agreement_id} not found for CREATED event")
-            return
-
-        if agreement.status == AgreementStatus.DRAFT:
-            agreement.created_tx_hash = event.tx_hash
-            agreement.created_onchain_at = event.processed_at  # Approximate
-            await self._agreement_repo.update_status(agreement, AgreementStatus.CREATED)
 
     async def _handle_payment_funded(self, event: OnchainEvent) -> None:
         """Handle PaymentFunded event."""
-        agreement = await self._agreement_repo.find_by_id(event.agreement_id)
-        if not agreement:
-            return
-
         # Idempotency: only update if not already funded or further
-        if agreement.status == AgreementStatus.CREATED:
-            agreement.funded_tx_hash = event.tx_hash
-            agreement.funded_at = event.processed_at
-            await self._agreement_repo.update_status(agreement, AgreementStatus.FUNDED)
+        await self._agreement_repo.transition(
+            event.agreement_id,
+            AgreementStatus.CREATED,
+            AgreementStatus.FUNDED,
+            funded_tx_hash=event.tx_hash,
+            funded_at=event.processed_at,
+        )
 
     async def _handle_dispute_opened(self, event: OnchainEvent) -> None:
         """Handle DisputeOpened event."""
@@ -122,7 +123,7 @@ class BlockchainEventService:
             return
 
         # Update Agreement Status
-        if agreement.status != AgreementStatus.DISPUTED:
+        if agreement.status is not AgreementStatus.DISPUTED:
             await self._agreement_repo.update_status(
                 agreement, AgreementStatus.DISPUTED
             )
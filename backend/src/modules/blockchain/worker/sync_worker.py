@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import Any
 
+from hexbytes import HexBytes
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import AsyncHTTPProvider, AsyncWeb3
@@ -38,8 +39,6 @@ def _hexbytes_to_json(obj: Any) -> Any:
     Returns:
         Object with all HexBytes and bytes converted to hex strings
     """
-    from hexbytes import HexBytes
-    
     if isinstance(obj, HexBytes):
         return obj.hex()
     elif isinstance(obj, bytes):
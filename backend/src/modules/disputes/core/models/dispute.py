@@ -3,12 +3,22 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.modules.disputes.core.enums import DisputeResolution, DisputeStatus
 from src.shared.database.base import Base
+from src.shared.database.types import HexBinary
 
 
 class Dispute(Base):
@@ -25,15 +35,15 @@ class Dispute(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
 
-    # Foreign key to agreement (unique - 1 dispute per agreement)
+    # Foreign key to agreement (unique - 1 dispute per agreement, enforced by
+    # idx_disputes_agreement_covering)
     agreement_id: Mapped[str] = mapped_column(
-        String(66),
+        HexBinary,
         ForeignKey("agreements.agreement_id"),
         nullable=False,
-        unique=True,
     )
 
     # Who opened the dispute (payer or payee)
@@ -45,14 +55,14 @@ class Dispute(Base):
 
     # Dispute status
     status: Mapped[DisputeStatus] = mapped_column(
-        ENUM(DisputeStatus, name="dispute_status_enum", create_type=False),
+        Enum(DisputeStatus, native_enum=False, length=32),
         nullable=False,
         server_default="OPEN",
     )
 
     # Resolution (set when dispute is resolved)
     resolution: Mapped[DisputeResolution | None] = mapped_column(
-        ENUM(DisputeResolution, name="dispute_resolution_enum", create_type=False),
+        Enum(DisputeResolution, native_enum=False, length=32),
         nullable=True,
     )
 
@@ -78,17 +88,33 @@ class Dispute(Base):
 
     __table_args__ = (
         CheckConstraint(
-            "(status = 'OPEN' "
-            "AND resolved_at IS NULL "
+            "status IN ('OPEN', 'RESOLVED')",
+            name="ck_disputes_status",
+        ),
+        CheckConstraint(
+            "resolution IN ('RELEASE', 'REFUND')",
+            name="ck_disputes_resolution",
+        ),
+        CheckConstraint(
+            "status <> 'OPEN' OR ("
+            "resolved_at IS NULL "
             "AND resolution IS NULL "
             "AND resolution_tx_hash IS NULL "
-            "AND justification IS NULL) "
-            "OR "
-            "(status = 'RESOLVED' "
-            "AND resolved_at IS NOT NULL "
+            "AND justification IS NULL)",
+            name="ck_disputes_open_nulls",
+        ),
+        CheckConstraint(
+            "status <> 'RESOLVED' OR ("
+            "resolved_at IS NOT NULL "
             "AND resolution IS NOT NULL "
             "AND resolution_tx_hash IS NOT NULL)",
-            name="ck_disputes_status_consistency",
+            name="ck_disputes_resolved_notnulls",
+        ),
+        Index(
+            "idx_disputes_agreement_covering",
+            "agreement_id",
+            unique=True,
+            postgresql_include=["status", "resolved_at"],
         ),
     )
 
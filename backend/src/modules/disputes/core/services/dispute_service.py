@@ -3,6 +3,7 @@
 import uuid
 
 from src.modules.agreements.core.exceptions import AgreementNotFoundError
+from src.modules.agreements.core.models import Agreement
 from src.modules.agreements.persistence import AgreementRepository
 from src.modules.disputes.core.exceptions import (
     DisputeAlreadyResolvedError,
@@ -34,7 +35,7 @@ class DisputeService:
 
     def _is_participant(
         self,
-        agreement: object,
+        agreement: Agreement,
         user_id: uuid.UUID,
     ) -> bool:
         """Check if a user is a participant in an agreement.
@@ -48,11 +49,7 @@ class DisputeService:
         Returns:
             True if the user is a participant, False otherwise.
         """
-        return user_id in (
-            agreement.payer_id,  # type: ignore[attr-defined]
-            agreement.payee_id,  # type: ignore[attr-defined]
-            agreement.arbitrator_id,  # type: ignore[attr-defined]
-        )
+        return user_id in agreement.participants
 
     async def get_dispute_for_agreement(
         self,
@@ -6,6 +6,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends
 
+from src.modules.agreements.schemas import AgreementId
 from src.modules.auth.module import get_current_user_id
 from src.modules.disputes.core.services import DisputeService
 from src.modules.disputes.module import get_dispute_service
@@ -21,7 +22,7 @@ router = APIRouter(prefix="/agreements", tags=["disputes"])
     description="Get the dispute details for an agreement. User must be a participant.",
 )
 async def get_dispute(
-    agreement_id: str,
+    agreement_id: AgreementId,
     service: Annotated[DisputeService, Depends(get_dispute_service)],
     user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
 ) -> DisputeResponse:
@@ -41,7 +42,7 @@ async def get_dispute(
     ),
 )
 async def submit_justification(
-    agreement_id: str,
+    agreement_id: AgreementId,
     request: SubmitJustificationRequest,
     service: Annotated[DisputeService, Depends(get_dispute_service)],
     user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
@@ -1,7 +1,7 @@
 """Dispute repository for database access."""
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
@@ -101,9 +101,8 @@ class DisputeRepository:
         dispute.resolution = resolution
         dispute.justification = justification
         dispute.resolution_tx_hash = resolution_tx_hash
-        dispute.resolved_at = datetime.now()
+        dispute.resolved_at = datetime.now(UTC)
         await self._session.flush()
-        await self._session.refresh(dispute)
         return dispute
 
     async def set_justification(
@@ -122,5 +121,4 @@ class DisputeRepository:
         """
         dispute.justification = justification
         await self._session.flush()
-        await self._session.refresh(dispute)
         return dispute
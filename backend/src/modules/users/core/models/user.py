@@ -1,14 +1,19 @@
 """User domain model (SQLAlchemy ORM entity)."""
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import CheckConstraint, DateTime, Text, func
-from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy import CheckConstraint, DateTime, Enum, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.modules.users.core.enums.user_enums import OAuthProvider
 from src.shared.database.base import Base
+from src.shared.database.types import HexBinary
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
 
 
 class User(Base):
@@ -19,14 +24,17 @@ class User(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
+        server_default=text("gen_random_uuid()"),
     )
 
     email: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
 
-    wallet_address: Mapped[str | None] = mapped_column(Text, nullable=True, unique=True)
+    wallet_address: Mapped[str | None] = mapped_column(
+        HexBinary, nullable=True, unique=True
+    )
 
     oauth_provider: Mapped[OAuthProvider | None] = mapped_column(
-        ENUM(OAuthProvider, name="oauth_provider_enum", create_type=False),
+        Enum(OAuthProvider, native_enum=False, length=32),
         nullable=True,
     )
 
@@ -41,14 +49,19 @@ class User(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=_utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
     )
 
     __table_args__ = (
         CheckConstraint(
-            "wallet_address ~ '^0x[0-9a-f]{40}$'",
-            name="ck_users_wallet_address_format",
+            "oauth_provider IN ('GOOGLE')",
+            name="ck_users_oauth_provider",
+        ),
+        CheckConstraint(
+            "octet_length(wallet_address) = 20",
+            name="ck_users_wallet_address_length",
         ),
     )
 
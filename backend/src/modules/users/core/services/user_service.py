@@ -118,11 +118,7 @@ class UserService:
         Raises:
             UserAlreadyExistsError: If a user with the same email exists.
         """
-        # Generate a new UUID for the user
-        user_id = uuid.uuid4()
-
         return await self._repository.create(
-            user_id=user_id,
             email=email,
             oauth_provider=oauth_provider,
             oauth_id=oauth_id,
@@ -29,6 +29,19 @@ class UserRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def exist_ids(self, user_ids: set[uuid.UUID]) -> set[uuid.UUID]:
+        """Return which of the given user IDs exist.
+
+        Args:
+            user_ids: The UUIDs to look up.
+
+        Returns:
+            The subset of user_ids that belong to existing users.
+        """
+        stmt = select(User.id).where(User.id.in_(user_ids))
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
+
     async def find_by_email(self, email: str) -> User | None:
         """Find a user by their email.
 
@@ -79,7 +92,6 @@ class UserRepository:
 
     async def create(
         self,
-        user_id: uuid.UUID,
         email: str,
         wallet_address: str | None = None,
         oauth_provider: OAuthProvider | None = None,
@@ -88,7 +100,6 @@ class UserRepository:
         """Create a new user.
 
         Args:
-            user_id: The UUID for the new user.
             email: The user's email address.
             wallet_address: The user's wallet address (lowercase normalized, optional).
             oauth_provider: The OAuth provider (optional).
@@ -101,7 +112,6 @@ class UserRepository:
             UserAlreadyExistsError: If a user with the same email or wallet exists.
         """
         user = User(
-            id=user_id,
             email=email,
             wallet_address=wallet_address.lower() if wallet_address else None,
             oauth_provider=oauth_provider,
@@ -141,7 +151,6 @@ class UserRepository:
 
         try:
             await self._session.flush()
-            await self._session.refresh(user)  # Reload database-generated values
         except IntegrityError as e:
             await self._session.rollback()
             raise UserAlreadyExistsError("wallet_address", wallet_address) from e
@@ -166,7 +175,6 @@ class UserRepository:
 
         try:
             await self._session.flush()
-            await self._session.refresh(user)
         except IntegrityError as e:
             await self._session.rollback()
             raise UserAlreadyExistsError("oauth_id", oauth_id) from e
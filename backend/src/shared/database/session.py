@@ -11,6 +11,13 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    connect_args={
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    },
+    query_cache_size=settings.db_query_cache_size,
 )
 
 async_session_factory = async_sessionmaker(
@@ -0,0 +1,28 @@
+"""Custom SQLAlchemy column types."""
+
+from typing import Any
+
+from sqlalchemy import Dialect, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+class HexBinary(TypeDecorator[str]):
+    """Stores a ``0x``-prefixed hex string as raw bytes (BYTEA).
+
+    Application code keeps reading and writing the hex form; the conversion
+    happens when values are bound to statements and when rows are loaded.
+    Loaded values are always lowercase.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return bytes.fromhex(value.removeprefix("0x"))
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return "0x" + value.hex()
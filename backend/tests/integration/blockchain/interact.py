@@ -19,7 +19,7 @@ from typing import Any
 from datetime import datetime, timedelta, timezone
 
 import asyncpg
-from jose import jwt
+import jwt
 import requests
 from dotenv import load_dotenv
 from web3 import Web3
@@ -54,7 +54,9 @@ async def create_test_users() -> None:
             # Insert user if not exists
             query = """
                 INSERT INTO users (id, email, wallet_address, oauth_provider, oauth_id, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, NOW(), NOW())
+                VALUES (
+                    $1, $2, decode(substring($3 FROM 3), 'hex'), $4, $5, NOW(), NOW()
+                )
                 ON CONFLICT (email) DO UPDATE
                 SET wallet_address = EXCLUDED.wallet_address
                 RETURNING id
@@ -68,7 +68,8 @@ async def verify_agreements(conn: asyncpg.Connection) -> bool:
     print_section("Checking Agreement States")
     
     agreements = await conn.fetch("""
-        SELECT agreement_id, status, created_tx_hash, funded_tx_hash, released_tx_hash, refunded_tx_hash
+        SELECT '0x' || encode(agreement_id, 'hex') AS agreement_id, status,
+               created_tx_hash, funded_tx_hash, released_tx_hash, refunded_tx_hash
         FROM agreements
         ORDER BY created_at
     """)
@@ -123,7 +124,10 @@ async def verify_users(conn: asyncpg.Connection) -> bool:
     """Verify that users were created from blockchain addresses."""
     print_section("Checking User Creation")
     
-    users = await conn.fetch("SELECT wallet_address FROM users WHERE wallet_address IS NOT NULL")
+    users = await conn.fetch(
+        "SELECT '0x' || encode(wallet_address, 'hex') AS wallet_address "
+        "FROM users WHERE wallet_address IS NOT NULL"
+    )
     
     if not users:
         print_result("Users created", False, "No users with wallet addresses found")
@@ -144,7 +148,8 @@ async def verify_disputes(conn: asyncpg.Connection) -> bool:
     print_section("Checking Dispute Records")
     
     disputes = await conn.fetch("""
-        SELECT agreement_id, resolution, resolution_tx_hash
+        SELECT '0x' || encode(agreement_id, 'hex') AS agreement_id, resolution,
+               resolution_tx_hash
         FROM disputes
         ORDER BY opened_at
     """)